@@ -0,0 +1,102 @@
+"""Measure the import time of the ecutils modules.
+
+Each module is imported in a fresh interpreter with ``python -X importtime``, several
+times, and the median cumulative import time is reported together with the heavy
+standard library modules that the import pulled in. The first, discarded, run of each
+module writes the bytecode caches.
+
+The script exits with status 1 if a budgeted module takes longer to import than its
+budget: the bare package `ecutils`, which should import nothing else, `ecutils.curves`,
+and `ecutils.algorithms`, which brings in the rest of the package.
+
+Usage:
+    python benchmarks/import_time.py [--runs N] [--budget MODULE=MILLISECONDS ...]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+MODULES = (
+    "ecutils",
+    "ecutils.core",
+    "ecutils.curves",
+    "ecutils.protocols",
+    "ecutils.algorithms",
+)
+
+# Modules that only some code paths need, and that imports should not pull in
+HEAVY_MODULES = ("multiprocessing", "concurrent.futures", "hashlib", "tempfile")
+
+# Import time budgets in milliseconds
+BUDGET_MS = {
+    "ecutils": 5.0,
+    "ecutils.curves": 25.0,
+    "ecutils.algorithms": 30.0,
+}
+
+
+def import_time(module: str):
+    """Import a module in a fresh interpreter.
+
+    Returns:
+        Tuple[float, List[str]]: The cumulative import time in milliseconds, and the
+            heavy modules imported along the way.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported = {}
+    for line in completed.stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, name = line.split("|")
+            imported[name.strip()] = int(cumulative)
+    heavy = [name for name in HEAVY_MODULES if name in imported]
+    return imported[module] / 1000, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15, help="imports per module")
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="MODULE=MILLISECONDS",
+        help="override the import time budget of a module, in ms",
+    )
+    args = parser.parse_args()
+    budgets = dict(BUDGET_MS)
+    for budget in args.budget:
+        module, _, milliseconds = budget.partition("=")
+        budgets[module] = float(milliseconds)
+
+    print(f"{'module':<22}{'median (ms)':>12}{'min (ms)':>10}  heavy imports")
+    medians = {}
+    for module in MODULES:
+        import_time(module)
+        times = []
+        for _ in range(args.runs):
+            elapsed, heavy = import_time(module)
+            times.append(elapsed)
+        medians[module] = statistics.median(times)
+        print(
+            f"{module:<22}{medians[module]:>12.1f}{min(times):>10.1f}  "
+            f"{', '.join(heavy) or '-'}"
+        )
+
+    exceeded = [
+        module for module, budget in budgets.items() if medians[module] > budget
+    ]
+    for module in exceeded:
+        print(f"\nImporting {module} exceeds the budget of {budgets[module]} ms")
+    if exceeded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
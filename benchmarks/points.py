@@ -0,0 +1,97 @@
+"""Compare the slot-based point types with the frozen dataclasses they replace.
+
+This measures, for `Point` and `JacobianPoint`:
+
+- the time to construct an instance;
+- the memory allocated per instance;
+- the time to hash an instance repeatedly, as cache lookups do;
+
+and the time of a variable-base scalar multiplication on secp256k1, which allocates
+thousands of Jacobian points.
+
+Usage:
+    python benchmarks/points.py [--number N] [--repeat R]
+"""
+
+import argparse
+import random
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from typing import Optional
+
+from ecutils import cache
+from ecutils.core import JacobianPoint, Point
+from ecutils.curves import secp256k1
+
+
+@dataclass(frozen=True)
+class DataclassPoint:
+    """The frozen dataclass `Point` of ecutils 1.1.4, for reference."""
+
+    x: Optional[int] = None
+    y: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class DataclassJacobianPoint:
+    """The frozen dataclass `JacobianPoint` of ecutils 1.1.4, for reference."""
+
+    x: Optional[int] = None
+    y: Optional[int] = None
+    z: int = 1
+
+
+def allocated_bytes(cls: type, coordinates: tuple, count: int = 10_000) -> float:
+    """Return the average number of bytes allocated per instance, coordinates excluded."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [cls(*coordinates) for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    # The list holding the instances takes one pointer per instance
+    return (after - before) / count - 8
+
+
+def best(statement, number: int, repeat: int) -> float:
+    """Return the best time per call, in microseconds."""
+    return min(timeit.repeat(statement, number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100_000, help="calls per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="timings per measure")
+    args = parser.parse_args()
+
+    g = secp256k1.G
+    print(f"{'type':<24}{'construct (us)':>16}{'hash x10 (us)':>16}{'bytes':>8}")
+    for cls, coordinates in (
+        (DataclassPoint, (g.x, g.y)),
+        (Point, (g.x, g.y)),
+        (DataclassJacobianPoint, (g.x, g.y, 1)),
+        (JacobianPoint, (g.x, g.y, 1)),
+    ):
+        instance = cls(*coordinates)
+        construct = best(lambda: cls(*coordinates), args.number, args.repeat)
+        hashing = best(
+            lambda: [hash(instance) for _ in range(10)], args.number // 10, args.repeat
+        )
+        size = allocated_bytes(cls, coordinates)
+        print(f"{cls.__name__:<24}{construct:>16.3f}{hashing:>16.3f}{size:>8.0f}")
+
+    # Distinct scalars and a disabled cache, so that every multiplication is computed
+    cache.configure(maxsize=0)
+    p = secp256k1.to_jacobian(secp256k1.multiply_point(0xC0FFEE, g))
+    scalars = [random.randrange(1, secp256k1.n) for _ in range(args.repeat * 20)]
+    iterator = iter(scalars)
+    multiply = best(
+        lambda: secp256k1.jacobian_multiply_point(next(iterator), p), 20, args.repeat
+    )
+    cache.reset_config()
+    print(f"\nsecp256k1 jacobian_multiply_point: {multiply / 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
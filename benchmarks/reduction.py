@@ -0,0 +1,76 @@
+"""Compare the modular reduction strategies available for the named curves.
+
+For every curve in `ecutils.curves`, this measures reducing random double-length
+products (as produced by a field multiplication) with:
+
+- the built-in ``%`` against a plain `int` modulus;
+- ``%`` against the modulus selected by `ecutils.field.fast_modulus`;
+- a pure-Python ``2**k - c`` folding loop, for reference.
+
+Usage:
+    python benchmarks/reduction.py [--samples N] [--repeat R]
+"""
+
+import argparse
+import random
+import timeit
+
+from ecutils import curves
+from ecutils.field import fast_modulus
+
+CURVE_NAMES = (
+    "secp192k1",
+    "secp192r1",
+    "secp224k1",
+    "secp224r1",
+    "secp256k1",
+    "secp256r1",
+    "secp384r1",
+    "secp521r1",
+)
+
+
+def folding_reduction(p: int):
+    """Build a reduction function for ``p = 2**k - c`` that repeatedly folds the high bits."""
+    k = p.bit_length()
+    mask = (1 << k) - 1
+    c = (1 << k) - p
+
+    def reduce(x: int) -> int:
+        while x >> k:
+            x = (x & mask) + (x >> k) * c
+        return x - p if x >= p else x
+
+    return reduce
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'curve':<10} {'builtin %':>10} {'selected':>10} {'folding':>10}  (ns/op)")
+    for name in CURVE_NAMES:
+        p = int(curves.get(name).p)
+        selected = fast_modulus(p)
+        fold = folding_reduction(p)
+        products = [random.randrange(p) * random.randrange(p) for _ in range(args.samples)]
+        assert all(x % selected == fold(x) == x % p for x in products)
+
+        timings = []
+        for stmt, namespace in (
+            ("for x in xs: x % p", {"p": p}),
+            ("for x in xs: x % p", {"p": selected}),
+            ("for x in xs: f(x)", {"f": fold}),
+        ):
+            seconds = timeit.timeit(
+                stmt, globals={"xs": products, **namespace}, number=args.repeat
+            )
+            timings.append(seconds / args.repeat / args.samples * 1e9)
+
+        print(f"{name:<10} {timings[0]:>10.0f} {timings[1]:>10.0f} {timings[2]:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
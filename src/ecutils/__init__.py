@@ -1 +1,17 @@
 __version__ = "1.1.4"
+
+__all__ = ["measure", "reset_stats", "stats"]
+
+
+def __getattr__(name: str):
+    # The cache statistics are re-exported from ecutils.cache, which is only imported
+    # on first access so that a bare `import ecutils` stays cheap.
+    if name in __all__:
+        from ecutils import cache
+
+        return getattr(cache, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,12 +1,38 @@
-import multiprocessing
-from dataclasses import dataclass
-from functools import lru_cache, partial
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain, islice
 from random import randint
-from typing import Tuple, Union
-
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ecutils.cache import cached
 from ecutils.core import EllipticCurve, Point
 from ecutils.curves import get as get_curve
-from ecutils.settings import LRU_CACHE_MAXSIZE
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    from typing import TextIO
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Scaling factor of the textual encoding, x = d * m + j
+TEXT_SCALING_FACTOR = 100
+# Minimum number of low bits of x left for the j search of the byte encoding
+MIN_J_BITS = 6
 
 
 @dataclass(frozen=True)
@@ -18,12 +44,24 @@ class Koblitz:
 
     Attributes:
         curve_name (str): The name of the elliptic curve to be used. Defaults to 'secp521r1'.
+        executor (Optional[Executor]): The executor encoding and decoding the chunks of lengthy
+            messages, e.g. one returned by `create_executor`. It is not shut down by this class.
+            Defaults to a process pool shared by all instances using the same curve, created on
+            first use.
+        chunksize (int): The number of chunks sent to a worker process at once. Defaults to 16.
+        parallel_threshold (int): The number of chunks below which lengthy messages are encoded
+            and decoded in the calling thread, where the executor overhead would outweigh the
+            work. Defaults to 16. Without an `executor`, lengthy messages are also handled in
+            the calling thread on single-processor machines.
     """
 
     curve_name: str = "secp521r1"
+    executor: Optional["Executor"] = field(default=None, compare=False, repr=False)
+    chunksize: int = field(default=16, compare=False)
+    parallel_threshold: int = field(default=16, compare=False)
 
     @property
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def curve(self) -> EllipticCurve:
         """Retrieves the elliptic curve associated with this `Koblitz` instance.
 
@@ -35,7 +73,46 @@ class Koblitz:
         """
         return get_curve(self.curve_name)
 
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
+    def chunk_size(self, alphabet_size: int = 2**8) -> int:
+        """Returns the number of characters encoded per point by `encode`.
+
+        That is 64 characters for `alphabet_size` 2**8 and 32 otherwise, capped to what
+        fits below the prime of the curve, so that lengthy messages stay decodable on the
+        smaller curves.
+
+        Args:
+            alphabet_size (int, optional): The size of the alphabet/character set used in the
+                message. Defaults to 2**8 (256) for ASCII encoding.
+
+        Returns:
+            int: The number of characters per chunk.
+        """
+        size = 64 if alphabet_size == 2**8 else 32
+        # The largest x is d * alphabet_size**size - 2, which must stay below p
+        while size > 1 and TEXT_SCALING_FACTOR * alphabet_size**size > self.curve.p:
+            size -= 1
+        return size
+
+    @property
+    @cached
+    def byte_packing(self) -> Tuple[int, int]:
+        """Returns the layout of the points of `encode_bytes`.
+
+        A chunk of `size` bytes is read as the integer ``m = int.from_bytes(b"\\x01" + chunk,
+        "big")``, where the leading sentinel byte keeps leading zero bytes and the chunk
+        length, and encoded as ``x = (m << shift) | j``. `size` is as large as the prime
+        allows while keeping at least `MIN_J_BITS` bits for `j`.
+
+        Returns:
+            Tuple[int, int]: The number of bytes per point and the shift.
+        """
+        # Keep x below 2**(p.bit_length() - 1), and so below p
+        bits = self.curve.p.bit_length() - 2
+        size = (bits - MIN_J_BITS) // 8
+        return size, bits - 8 * size
+
+    @cached
     def encode(
         self, message: str, alphabet_size: int = 2**8, lengthy=False
     ) -> Union[Tuple[Tuple[Point, int]], Tuple[Point, int]]:
@@ -66,50 +143,24 @@ class Koblitz:
                 as the single tuple described above.
         """
 
-        if alphabet_size == 2**8:
-            size = 64
-        else:
-            size = 32
+        size = self.chunk_size(alphabet_size)
 
         # Encode a single message
         if not lengthy:
-            # Convert the string message to a single large integer
-            message_decimal = sum(
-                ord(char) * (alphabet_size**i) for i, char in enumerate(message[:size])
-            )
-
-            # Search for a valid curve point using the Koblitz method
-            d = 100  # Scaling factor
-            for j in range(1, d - 1):
-                x = (d * message_decimal + j) % self.curve.p
-                s = (x**3 + self.curve.a * x + self.curve.b) % self.curve.p
-
-                # Check if 's' is a quadratic residue modulo 'p', meaning 'y' can be computed
-                if s == pow(s, (self.curve.p + 1) // 2, self.curve.p):
-                    y = pow(s, (self.curve.p + 1) // 4, self.curve.p)
-
-                    # Verify that the computed point is on the curve
-                    if self.curve.is_point_on_curve(Point(x, y)):
-                        break
-
-            return Point(x, y), j
+            return self.encode_chunk(message[:size], alphabet_size)
 
-        # Initialize a multiprocessing pool
-        pool = multiprocessing.Pool()
+        chunks = [message[i : i + size] for i in range(0, len(message), size)]
+        if not self.use_executor(len(chunks)):
+            return tuple(self.encode_chunk(chunk, alphabet_size) for chunk in chunks)
 
-        # Execute the encode function in parallel using the pool
-        encoded_messages = pool.map(
-            partial(self.encode, alphabet_size=alphabet_size, lengthy=False),
-            [message[i : i + size] for i in range(0, len(message), size)],
+        encoded_messages = self.get_executor().map(
+            partial(_encode_chunk, self.curve_name, alphabet_size),
+            chunks,
+            chunksize=self.chunksize,
         )
-
-        # Close the pool
-        pool.close()
-        pool.join()
-
         return tuple(encoded_messages)
 
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def decode(
         self,
         encoded: Union[Point, tuple[Tuple[Point, int]]],
@@ -145,18 +196,7 @@ class Koblitz:
 
         # Decode single point
         if not lengthy and isinstance(encoded, Point):
-            # Calculate the original large integer from the point and 'j'
-            d = 100  # Assuming 'd' is a scaling factor used in encoding
-            message_decimal = (encoded.x - j) // d
-
-            # Decompose the large integer into individual characters based on `alphabet_size`
-            characters = []
-            while message_decimal != 0:
-                characters.append(chr(message_decimal % alphabet_size))
-                message_decimal //= alphabet_size
-
-            # Convert the list of characters into a string and return it
-            return "".join(characters)
+            return self.decode_chunk(encoded, j, alphabet_size)
 
         # Decode tuple of (Point, int) pairs
         is_tuple_of_point_int = lambda instance: isinstance(instance, tuple) and all(
@@ -169,22 +209,388 @@ class Koblitz:
 
         characters = []
         if is_tuple_of_point_int(encoded):
+            if not self.use_executor(len(encoded)):
+                characters = [
+                    self.decode_chunk(point, j, alphabet_size) for point, j in encoded
+                ]
+            else:
+                characters = self.get_executor().map(
+                    partial(_decode_chunk, self.curve_name, alphabet_size),
+                    [point for point, _ in encoded],
+                    [j for _, j in encoded],
+                    chunksize=self.chunksize,
+                )
+
+        return "".join(characters)
+
+    def encode_chunk(self, message: str, alphabet_size: int = 2**8) -> Tuple[Point, int]:
+        """Encodes one chunk of a message to a point, without caching the result.
+
+        This is the work unit of `encode`, `encode_stream` and the executor workers.
+
+        Args:
+            message (str): The chunk, of at most `chunk_size(alphabet_size)` characters.
+            alphabet_size (int, optional): The size of the alphabet/character set used in the
+                message. Defaults to 2**8 (256) for ASCII encoding.
+
+        Returns:
+            Tuple[Point, int]: The encoded point and the auxiliary value `j`.
+        """
+        # Convert the string message to a single large integer
+        message_decimal = sum(
+            ord(char) * (alphabet_size**i) for i, char in enumerate(message)
+        )
+
+        # Search for a valid curve point using the Koblitz method
+        d = TEXT_SCALING_FACTOR
+        for j in range(1, d - 1):
+            x = (d * message_decimal + j) % self.curve.p
+            s = (x**3 + self.curve.a * x + self.curve.b) % self.curve.p
 
-            # Initialize a multiprocessing pool
-            pool = multiprocessing.Pool()
+            # Check if 's' is a quadratic residue modulo 'p', meaning 'y' can be computed
+            if self.curve.is_square_mod_p(s):
+                # sqrt_mod_p checks its root, so (x, y) is on the curve once y is found
+                y = self.curve.sqrt_mod_p(s)
+                if y is not None:
+                    break
+
+        return Point(x, y), j
+
+    def decode_chunk(self, encoded: Point, j: int, alphabet_size: int = 2**8) -> str:
+        """Decodes one point back to a chunk of a message, without caching the result.
+
+        Args:
+            encoded (Point): The encoded point.
+            j (int): The auxiliary value returned with the point by `encode_chunk`.
+            alphabet_size (int, optional): The size of the alphabet/character set used in the
+                message. Defaults to 2**8 (256) for ASCII encoding.
+
+        Returns:
+            str: The decoded chunk.
+        """
+        return self.decode_coordinate(encoded.x, j, alphabet_size)
+
+    def decode_coordinate(self, x: int, j: int, alphabet_size: int = 2**8) -> str:
+        """Decodes the x coordinate of an encoded point back to a chunk of a message.
+
+        Decoding only needs the x coordinate, so encoded points stored without their y
+        coordinate can be decoded without recomputing it.
+
+        Args:
+            x (int): The x coordinate of the encoded point.
+            j (int): The auxiliary value returned with the point by `encode_chunk`.
+            alphabet_size (int, optional): The size of the alphabet/character set used in the
+                message. Defaults to 2**8 (256) for ASCII encoding.
 
-            # Execute the decode function in parallel using the pool
-            characters = pool.starmap(
-                partial(self.decode, alphabet_size=alphabet_size, lengthy=False),
-                [(i[0], i[1]) for i in encoded],
-            )
+        Returns:
+            str: The decoded chunk.
+        """
+        # Calculate the original large integer from the point and 'j'
+        d = TEXT_SCALING_FACTOR
+        message_decimal = (x - j) // d
 
-            # Close the pool
-            pool.close()
-            pool.join()
+        # Decompose the large integer into individual characters based on `alphabet_size`
+        characters = []
+        while message_decimal != 0:
+            characters.append(chr(message_decimal % alphabet_size))
+            message_decimal //= alphabet_size
 
+        # Convert the list of characters into a string and return it
         return "".join(characters)
 
+    def encode_bytes(self, data: bytes) -> Tuple[Point, ...]:
+        """Encodes binary data to points on the elliptic curve, packed densely.
+
+        The data is split into chunks of as many bytes as fit below the prime of the
+        curve (see `byte_packing`), converted with `int.from_bytes` and shifted to leave
+        room for the search of a point. The search value `j` is kept in the low bits of
+        ``x``, so only the points are returned. The result is not cached.
+
+        Args:
+            data (bytes): The data to encode. Text should be encoded to bytes first, e.g.
+                with `str.encode`.
+
+        Returns:
+            Tuple[Point, ...]: The encoded points, one per chunk, in data order.
+        """
+        size, _ = self.byte_packing
+        view = memoryview(data)
+        return tuple(
+            self.encode_bytes_chunk(view[i : i + size])
+            for i in range(0, len(view), size)
+        )
+
+    def decode_bytes(self, encoded: Iterable[Point]) -> bytes:
+        """Decodes points produced by `encode_bytes` back to the data.
+
+        Args:
+            encoded (Iterable[Point]): The encoded points, in data order.
+
+        Returns:
+            bytes: The decoded data.
+
+        Raises:
+            ValueError: If a point was not produced by `encode_bytes` on this curve.
+        """
+        return b"".join(self.decode_bytes_chunk(point) for point in encoded)
+
+    def encode_bytes_chunk(self, chunk: bytes) -> Point:
+        """Encodes one chunk of binary data to a point.
+
+        Args:
+            chunk (bytes): The chunk, of at most `byte_packing[0]` bytes.
+
+        Returns:
+            Point: The encoded point, with ``x = (m << shift) | j`` where `m` is the chunk
+                read as a big-endian integer behind a ``0x01`` sentinel byte.
+
+        Raises:
+            ValueError: If the chunk is too large for the curve, or if no point is found.
+        """
+        size, shift = self.byte_packing
+        if len(chunk) > size:
+            raise ValueError(f"Chunks hold at most {size} bytes on this curve.")
+        p, a, b = self.curve.p, self.curve.a, self.curve.b
+        base = int.from_bytes(b"\x01" + bytes(chunk), "big") << shift
+
+        for j in range(1 << shift):
+            x = base | j
+            s = (x * x * x + a * x + b) % p
+
+            # Check if 's' is a quadratic residue modulo 'p', meaning 'y' can be computed
+            if self.curve.is_square_mod_p(s):
+                return Point(x, self.curve.sqrt_mod_p(s))
+
+        raise ValueError("No point found for the chunk.")
+
+    def decode_bytes_chunk(self, encoded: Point) -> bytes:
+        """Decodes one point produced by `encode_bytes_chunk` back to the chunk.
+
+        Args:
+            encoded (Point): The encoded point.
+
+        Returns:
+            bytes: The decoded chunk.
+
+        Raises:
+            ValueError: If the point was not produced by `encode_bytes_chunk` on this curve.
+        """
+        _, shift = self.byte_packing
+        message = encoded.x >> shift
+        data = message.to_bytes((message.bit_length() + 7) // 8, "big")
+        if data[:1] != b"\x01":
+            raise ValueError("The point does not encode a chunk of bytes.")
+        return data[1:]
+
+    def encode_stream(
+        self,
+        reader: "TextIO",
+        alphabet_size: int = 2**8,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[Tuple[Point, int]]:
+        """Encodes a message read from a text file-like object, one chunk at a time.
+
+        Unlike `encode` with `lengthy=True`, the message is never held in memory as a whole
+        and the results are not cached: chunks are read as the encoded points are consumed.
+        The chunks are the same as those of `encode`, so the generated pairs are equal to
+        the items of `encode(message, alphabet_size, lengthy=True)`.
+
+        Batches of `chunksize` chunks are submitted to the executor, with at most
+        `max_pending` batches in flight. Reading stops while that many batches wait to be
+        consumed, which bounds the memory used by a slow consumer.
+
+        Args:
+            reader (TextIO): An object with a `read(size)` method returning strings, such as
+                a file opened in text mode or an `io.StringIO`.
+            alphabet_size (int, optional): The size of the alphabet/character set used in the
+                message. Defaults to 2**8 (256) for ASCII encoding.
+            max_pending (Optional[int], optional): The maximum number of batches submitted to
+                the executor and not yet consumed. Defaults to twice the number of processors.
+
+        Yields:
+            Tuple[Point, int]: The encoded point and the auxiliary value `j` of each chunk,
+                in message order.
+        """
+        size = self.chunk_size(alphabet_size)
+
+        def chunks() -> Iterator[str]:
+            while True:
+                chunk = reader.read(size)
+                # Text streams may return fewer characters than requested before EOF
+                while chunk and len(chunk) < size:
+                    more = reader.read(size - len(chunk))
+                    if not more:
+                        break
+                    chunk += more
+                if not chunk:
+                    return
+                yield chunk
+
+        return self._pipeline(
+            partial(self.encode_chunk, alphabet_size=alphabet_size),
+            partial(_encode_chunks, self.curve_name, alphabet_size),
+            chunks(),
+            max_pending,
+        )
+
+    def decode_stream(
+        self,
+        encoded: Iterable[Tuple[Point, int]],
+        alphabet_size: int = 2**8,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Decodes a stream of encoded points, one chunk at a time.
+
+        This is the counterpart of `encode_stream`: `encoded` may be a generator, and it is
+        consumed as the decoded chunks are, with the same batching and backpressure.
+
+        Args:
+            encoded (Iterable[Tuple[Point, int]]): The encoded points and their auxiliary
+                values `j`, in message order.
+            alphabet_size (int, optional): The size of the alphabet/character set used in the
+                message. Defaults to 2**8 (256) for ASCII encoding.
+            max_pending (Optional[int], optional): The maximum number of batches submitted to
+                the executor and not yet consumed. Defaults to twice the number of processors.
+
+        Yields:
+            str: The decoded chunks, in message order. Joined, they form the message.
+        """
+        return self._pipeline(
+            lambda pair: self.decode_chunk(pair[0], pair[1], alphabet_size),
+            partial(_decode_chunks, self.curve_name, alphabet_size),
+            iter(encoded),
+            max_pending,
+        )
+
+    def _pipeline(
+        self,
+        function: Callable[[T], R],
+        batch_function: Callable[[List[T]], List[R]],
+        items: Iterator[T],
+        max_pending: Optional[int],
+    ) -> Iterator[R]:
+        # Read ahead up to the parallel threshold, so short streams skip the executor
+        head = list(islice(items, self.parallel_threshold))
+        if not self.use_executor(len(head)):
+            yield from map(function, head)
+            yield from map(function, items)
+            return
+
+        if max_pending is None:
+            max_pending = 2 * (os.cpu_count() or 1)
+        if max_pending < 1:
+            raise ValueError("max_pending must be positive.")
+        chunksize = max(self.chunksize, 1)
+
+        executor = self.get_executor()
+        pending = deque()
+        items = chain(head, items)
+        try:
+            for batch in iter(lambda: list(islice(items, chunksize)), []):
+                pending.append(executor.submit(batch_function, batch))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def use_executor(self, chunks: int) -> bool:
+        """Returns True if a lengthy message of `chunks` chunks is worth sending to the executor."""
+        if chunks < self.parallel_threshold:
+            return False
+        return self.executor is not None or (os.cpu_count() or 1) > 1
+
+    def get_executor(self) -> "Executor":
+        """Returns the executor used for lengthy messages.
+
+        Returns:
+            Executor: The `executor` attribute if set, otherwise the process pool shared
+                by all `Koblitz` instances using the same curve.
+        """
+        if self.executor is not None:
+            return self.executor
+        with _shared_executors_lock:
+            executor = _shared_executors.get(self.curve_name)
+            if executor is None:
+                executor = _shared_executors[self.curve_name] = create_executor(
+                    self.curve_name
+                )
+        return executor
+
+
+_worker_instances: Dict[str, Koblitz] = {}
+_shared_executors: Dict[str, "Executor"] = {}
+_shared_executors_lock = threading.Lock()
+
+
+def create_executor(
+    curve_name: str = "secp521r1",
+    max_workers: Optional[int] = None,
+    threads: bool = False,
+) -> "Executor":
+    """Creates a persistent executor for the lengthy messages of `Koblitz`.
+
+    Each worker builds the curve once, when it starts, and then only receives message
+    chunks. The executor is meant to be created once and passed to every `Koblitz`
+    instance through its `executor` attribute; the caller shuts it down.
+
+    Custom curves registered with `ecutils.curves.register` are only known to worker
+    processes started with the "fork" method, or to threads.
+
+    Args:
+        curve_name (str): The name of the elliptic curve the workers are initialized with.
+            Defaults to 'secp521r1'.
+        max_workers (Optional[int]): The number of workers. Defaults to the executor's
+            default, based on the number of processors.
+        threads (bool): If True, create a thread pool instead of a process pool.
+            Defaults to False.
+
+    Returns:
+        Executor: A `concurrent.futures.ProcessPoolExecutor`, or a `ThreadPoolExecutor`.
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    executor_class = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    return executor_class(
+        max_workers, initializer=_initialize_worker, initargs=(curve_name,)
+    )
+
+
+def _initialize_worker(curve_name: str):
+    # Build the curve once per worker
+    _worker_instance(curve_name).curve
+
+
+def _worker_instance(curve_name: str) -> Koblitz:
+    koblitz = _worker_instances.get(curve_name)
+    if koblitz is None:
+        koblitz = _worker_instances.setdefault(curve_name, Koblitz(curve_name))
+    return koblitz
+
+
+def _encode_chunk(curve_name: str, alphabet_size: int, chunk: str) -> Tuple[Point, int]:
+    return _worker_instance(curve_name).encode_chunk(chunk, alphabet_size)
+
+
+def _decode_chunk(curve_name: str, alphabet_size: int, point: Point, j: int) -> str:
+    return _worker_instance(curve_name).decode_chunk(point, j, alphabet_size)
+
+
+def _encode_chunks(
+    curve_name: str, alphabet_size: int, chunks: List[str]
+) -> List[Tuple[Point, int]]:
+    koblitz = _worker_instance(curve_name)
+    return [koblitz.encode_chunk(chunk, alphabet_size) for chunk in chunks]
+
+
+def _decode_chunks(
+    curve_name: str, alphabet_size: int, pairs: List[Tuple[Point, int]]
+) -> List[str]:
+    koblitz = _worker_instance(curve_name)
+    return [koblitz.decode_chunk(point, j, alphabet_size) for point, j in pairs]
+
 
 @dataclass(frozen=True)
 class DigitalSignature:
@@ -201,7 +607,7 @@ class DigitalSignature:
     curve_name: str = "secp192k1"
 
     @property
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def curve(self) -> EllipticCurve:
         """Retrieves the elliptic curve associated with this `DigitalSignature` instance.
 
@@ -215,7 +621,7 @@ class DigitalSignature:
         return get_curve(self.curve_name)
 
     @property
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def public_key(self) -> Point:
         """Computes and returns the public key corresponding to the private key.
 
@@ -231,7 +637,7 @@ class DigitalSignature:
         """
         return self.curve.multiply_point(self.private_key, self.curve.G)
 
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def generate_signature(self, message_hash: int) -> Tuple[int, int]:
         """Generates an ECDSA signature for a given message hash using the private key.
 
@@ -262,7 +668,7 @@ class DigitalSignature:
             ) % self.curve.n
         return r, s
 
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def verify_signature(
         self, public_key: Point, message_hash: int, r: int, s: int
     ) -> bool:
@@ -299,9 +705,8 @@ class DigitalSignature:
         w = pow(s, -1, self.curve.n)
         u_1 = (message_hash * w) % self.curve.n
         u_2 = (r * w) % self.curve.n
-        p = self.curve.add_points(
-            self.curve.multiply_point(u_1, self.curve.G),
-            self.curve.multiply_point(u_2, public_key),
-        )
+        p = self.curve.multiply_add(u_1, self.curve.G, u_2, public_key)
+        if p.x is None:
+            return False
         v = p.x % self.curve.n
         return v == r
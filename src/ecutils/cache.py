@@ -0,0 +1,497 @@
+import sys
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from functools import update_wrapper
+from types import MethodType
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from ecutils.settings import LRU_CACHE_MAXSIZE
+
+POLICIES = ("lru", "lfu", "none")
+
+_UNSET: Any = object()
+_KWARGS_MARK = object()
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    """Configuration of the method caches.
+
+    Attributes:
+        policy (str): The eviction policy: 'lru' (least recently used), 'lfu' (least
+            frequently used) or 'none' to disable caching.
+        maxsize (Optional[int]): The maximum number of entries of each partition, or None
+            for no limit. A value of 0 disables caching. Defaults to the
+            `LRU_CACHE_MAXSIZE` environment variable, or 1024.
+        max_bytes (Optional[int]): The maximum estimated size in bytes of the keys and
+            values of each partition, or None for no limit.
+    """
+
+    policy: str = "lru"
+    maxsize: Optional[int] = LRU_CACHE_MAXSIZE
+    max_bytes: Optional[int] = None
+
+    @property
+    def enabled(self) -> bool:
+        """True if this configuration caches anything at all."""
+        return self.policy != "none" and self.maxsize != 0 and self.max_bytes != 0
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Statistics of one cached operation.
+
+    Attributes:
+        hits (int): The number of calls answered from the cache.
+        misses (int): The number of calls that ran the operation, including every call
+            made while caching was disabled.
+        evictions (int): The number of entries evicted to respect the size budgets.
+        size (int): The number of entries currently cached, over all partitions.
+        bytes (int): The estimated size in bytes of the entries currently cached.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of calls answered from the cache, or 0.0 if there were none."""
+        calls = self.hits + self.misses
+        return self.hits / calls if calls else 0.0
+
+    def __sub__(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(
+            self.hits - other.hits,
+            self.misses - other.misses,
+            self.evictions - other.evictions,
+            self.size - other.size,
+            self.bytes - other.bytes,
+        )
+
+
+_default_config = CacheConfig()
+_operation_configs: Dict[str, CacheConfig] = {}
+
+# Hit, miss and eviction counts of every cached operation, keyed by qualified name
+_operation_counters: Dict[str, List[int]] = {}
+
+# functools.lru_cache wrappers reported by `stats` next to the cached methods
+_lru_caches: Dict[str, Callable] = {}
+
+# Partitions of every live instance, keyed by the instance's id and then by the
+# qualified name of the cached method. A partition of None means caching is disabled.
+_partitions: Dict[int, Dict[str, Optional["CachePartition"]]] = {}
+
+
+def estimate_size(obj: Any) -> int:
+    """Estimate the memory used by an object and the objects it references, in bytes.
+
+    Containers, dataclass-like objects and objects with ``__slots__`` are traversed;
+    everything else is measured with `sys.getsizeof`.
+
+    Args:
+        obj (Any): The object to measure.
+
+    Returns:
+        int: The estimated size in bytes.
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (tuple, list, frozenset, set)):
+        return size + sum(estimate_size(item) for item in obj)
+    if isinstance(obj, dict):
+        return size + sum(estimate_size(k) + estimate_size(v) for k, v in obj.items())
+    if isinstance(obj, (int, float, str, bytes, type(None))):
+        return size
+    for name in getattr(type(obj), "__slots__", ()):
+        size += estimate_size(getattr(obj, name, None))
+    if hasattr(obj, "__dict__"):
+        size += sum(estimate_size(v) for v in vars(obj).values())
+    return size
+
+
+class CachePartition:
+    """The cached results of one method for one instance.
+
+    Entries are evicted according to the configured policy whenever the partition
+    holds more than `maxsize` entries or more than `max_bytes` estimated bytes.
+    """
+
+    def __init__(self, config: CacheConfig, counters: Optional[List[int]] = None):
+        self.config = config
+        # [hits, misses, evictions], shared by every partition of the same operation
+        self.counters = counters if counters is not None else [0, 0, 0]
+        self.maxsize = config.maxsize
+        self.lfu = config.policy == "lfu"
+        self.lru_only = not self.lfu and config.max_bytes is None
+        self.entries: "OrderedDict[Any, Any]" = OrderedDict()
+        self.sizes: Dict[Any, int] = {}
+        self.frequencies: Dict[Any, int] = {}
+        self.frequency_buckets: Dict[int, "OrderedDict[Any, None]"] = {}
+        self.min_frequency = 0
+        self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Any) -> Any:
+        """Return the value cached under `key`, or `_UNSET`, updating its recency or frequency."""
+        value = self.entries.get(key, _UNSET)
+        if value is not _UNSET:
+            try:
+                if self.lfu:
+                    self._touch_frequency(key)
+                else:
+                    self.entries.move_to_end(key)
+            except KeyError:  # Evicted concurrently by another thread
+                pass
+        return value
+
+    def put(self, key: Any, value: Any):
+        """Cache `value` under `key`, evicting other entries if the partition is full."""
+        if self.lru_only:
+            # Fast path: least recently used eviction bounded by entry count only
+            self.entries[key] = value
+            if self.maxsize is not None and len(self.entries) > self.maxsize:
+                try:
+                    self.entries.popitem(last=False)
+                    self.counters[2] += 1
+                except KeyError:  # Emptied concurrently by another thread
+                    pass
+            return
+
+        if key in self.entries:
+            return
+        size = 0
+        if self.config.max_bytes is not None:
+            size = estimate_size(key) + estimate_size(value)
+            if size > self.config.max_bytes:
+                return
+            self.sizes[key] = size
+            self.bytes += size
+
+        self.entries[key] = value
+        if self.lfu:
+            self.frequencies[key] = 1
+            self.frequency_buckets.setdefault(1, OrderedDict())[key] = None
+            self.min_frequency = 1
+
+        maxsize = self.config.maxsize
+        max_bytes = self.config.max_bytes
+        while (maxsize is not None and len(self.entries) > maxsize) or (
+            max_bytes is not None and self.bytes > max_bytes
+        ):
+            self._evict(protected=key)
+
+    def estimated_bytes(self) -> int:
+        """Return the estimated size in bytes of the keys and values held by the partition."""
+        if self.config.max_bytes is not None:
+            return self.bytes
+        return sum(
+            estimate_size(key) + estimate_size(value)
+            for key, value in list(self.entries.items())
+        )
+
+    def clear(self):
+        """Remove every entry from the partition."""
+        self.entries.clear()
+        self.sizes.clear()
+        self.frequencies.clear()
+        self.frequency_buckets.clear()
+        self.min_frequency = 0
+        self.bytes = 0
+
+    def _touch_frequency(self, key: Any):
+        frequency = self.frequencies[key]
+        bucket = self.frequency_buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self.frequency_buckets[frequency]
+            if self.min_frequency == frequency:
+                self.min_frequency = frequency + 1
+        self.frequencies[key] = frequency + 1
+        self.frequency_buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+    def _evict(self, protected: Any):
+        try:
+            if self.lfu:
+                victim = self._lfu_victim(protected)
+                frequency = self.frequencies.pop(victim)
+                bucket = self.frequency_buckets[frequency]
+                del bucket[victim]
+                if not bucket:
+                    del self.frequency_buckets[frequency]
+                if not self.frequency_buckets:
+                    self.min_frequency = 0
+                elif frequency == self.min_frequency:
+                    self.min_frequency = min(self.frequency_buckets)
+            else:
+                victim = next(iter(self.entries))
+            del self.entries[victim]
+        except (KeyError, StopIteration, ValueError):  # Emptied concurrently
+            self.bytes = sum(self.sizes.values())
+            return
+        self.bytes -= self.sizes.pop(victim, 0)
+        self.counters[2] += 1
+
+    def _lfu_victim(self, protected: Any) -> Any:
+        for key in self.frequency_buckets[self.min_frequency]:
+            if key != protected or len(self.entries) == 1:
+                return key
+        # The newest entry is alone in the lowest bucket; evict from the next one
+        return next(
+            key
+            for frequency in sorted(self.frequency_buckets)
+            for key in self.frequency_buckets[frequency]
+            if key != protected
+        )
+
+
+class cached:
+    """Decorator caching the results of a method in per-instance partitions.
+
+    Unlike `functools.lru_cache`, the instance is not part of the cache key: each
+    instance, for example each `EllipticCurve`, gets its own partition identified by
+    ``id(instance)``, so instances never evict each other's entries and are never
+    rehashed. Partitions are held through weak references and are dropped when their
+    instance is garbage collected, so instances must support weak references. The
+    eviction policy and size budgets are read from `configure` at run time.
+
+    The qualified name of the decorated function (e.g. 'EllipticCurveOperations.add_points')
+    identifies the cached operation.
+    """
+
+    def __init__(self, func: Callable):
+        self.func = func
+        self.name = func.__qualname__
+        self.counters = _operation_counters.setdefault(self.name, [0, 0, 0])
+        update_wrapper(self, func)
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        return MethodType(self, instance)
+
+    def __call__(self, instance: Any, *args: Any, **kwargs: Any) -> Any:
+        try:
+            partition = _partitions[id(instance)][self.name]
+        except KeyError:
+            partition = _create_partition(instance, self.name)
+
+        if partition is None:
+            self.counters[1] += 1
+            return self.func(instance, *args, **kwargs)
+
+        key = args
+        if kwargs:
+            key = args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+        value = partition.get(key)
+        if value is _UNSET:
+            self.counters[1] += 1
+            value = self.func(instance, *args, **kwargs)
+            partition.put(key, value)
+        else:
+            self.counters[0] += 1
+        return value
+
+
+def _create_partition(instance: Any, name: str) -> Optional[CachePartition]:
+    key = id(instance)
+    partitions = _partitions.get(key)
+    if partitions is None:
+        try:
+            weakref.finalize(instance, _partitions.pop, key, None)
+        except TypeError:
+            raise TypeError(
+                f"{name} is cached per instance, but {type(instance).__name__} "
+                "instances do not support weak references."
+            ) from None
+        partitions = _partitions[key] = {}
+    config = get_config(name)
+    partition = None
+    if config.enabled:
+        partition = CachePartition(config, _operation_counters.setdefault(name, [0, 0, 0]))
+    partitions[name] = partition
+    return partition
+
+
+def get_config(operation: Optional[str] = None) -> CacheConfig:
+    """Return the cache configuration of an operation, or the default one.
+
+    Args:
+        operation (Optional[str]): The qualified name of a cached method, such as
+            'EllipticCurveOperations.multiply_point'. Defaults to None.
+
+    Returns:
+        CacheConfig: The configuration in effect.
+    """
+    if operation is None:
+        return _default_config
+    return _operation_configs.get(operation, _default_config)
+
+
+def configure(
+    policy: Optional[str] = None,
+    maxsize: Optional[int] = _UNSET,
+    max_bytes: Optional[int] = _UNSET,
+    operations: Optional[Iterable[str]] = None,
+) -> CacheConfig:
+    """Change the cache configuration at run time.
+
+    Existing cache entries of the affected operations are discarded.
+
+    Args:
+        policy (Optional[str]): 'lru', 'lfu' or 'none'. Unchanged if None.
+        maxsize (Optional[int]): The maximum number of entries per partition, or None for
+            no limit. Unchanged if omitted.
+        max_bytes (Optional[int]): The maximum estimated bytes per partition, or None for
+            no limit. Unchanged if omitted.
+        operations (Optional[Iterable[str]]): Qualified names of the cached methods to
+            configure, such as 'DigitalSignature.verify_signature'. If None, the default
+            configuration, shared by all operations without their own, is changed.
+
+    Returns:
+        CacheConfig: The new default configuration, or that of the last operation given.
+
+    Raises:
+        ValueError: If `policy` is not one of 'lru', 'lfu' or 'none'.
+    """
+    global _default_config
+
+    if policy is not None and policy not in POLICIES:
+        raise ValueError(f"Unknown cache policy {policy!r}; expected one of {POLICIES}.")
+
+    changes = {}
+    if policy is not None:
+        changes["policy"] = policy
+    if maxsize is not _UNSET:
+        changes["maxsize"] = maxsize
+    if max_bytes is not _UNSET:
+        changes["max_bytes"] = max_bytes
+
+    if operations is None:
+        _default_config = replace(_default_config, **changes)
+        clear()
+        return _default_config
+
+    config = _default_config
+    for operation in operations:
+        config = _operation_configs[operation] = replace(get_config(operation), **changes)
+        clear(operation)
+    return config
+
+
+def reset_config():
+    """Restore the default configuration for every operation and clear all caches."""
+    global _default_config
+    _default_config = CacheConfig()
+    _operation_configs.clear()
+    clear()
+
+
+def clear(operation: Optional[str] = None):
+    """Discard cached entries.
+
+    Args:
+        operation (Optional[str]): The qualified name of the cached method to clear. If
+            None, the caches of every operation are cleared.
+    """
+    for partitions in list(_partitions.values()):
+        if operation is None:
+            partitions.clear()
+        else:
+            partitions.pop(operation, None)
+
+
+def register_lru_cache(name: str, func: Callable):
+    """Report a `functools.lru_cache` wrapped function in `stats`.
+
+    Args:
+        name (str): The name under which the function is reported.
+        func (Callable): The function returned by `functools.lru_cache`.
+    """
+    _lru_caches[name] = func
+
+
+def stats(with_bytes: bool = True) -> Dict[str, CacheStats]:
+    """Report the hits, misses, evictions, size and estimated bytes of every cache.
+
+    Args:
+        with_bytes (bool): If False, skip the estimation of the cached bytes, which
+            walks every entry of partitions without a byte budget. Defaults to True.
+
+    Returns:
+        Dict[str, CacheStats]: The statistics of each cached operation, keyed by its
+            qualified name, such as 'EllipticCurveOperations.multiply_point'.
+    """
+    sizes: Dict[str, List[int]] = {}
+    for partitions in list(_partitions.values()):
+        for name, partition in list(partitions.items()):
+            if partition is None:
+                continue
+            size = sizes.setdefault(name, [0, 0])
+            size[0] += len(partition)
+            if with_bytes:
+                size[1] += partition.estimated_bytes()
+
+    report = {}
+    for name, (hits, misses, evictions) in list(_operation_counters.items()):
+        size, nbytes = sizes.get(name, (0, 0))
+        report[name] = CacheStats(hits, misses, evictions, size, nbytes)
+
+    for name, func in _lru_caches.items():
+        info = func.cache_info()
+        report[name] = CacheStats(
+            info.hits,
+            info.misses,
+            max(0, info.misses - info.currsize) if info.maxsize is not None else 0,
+            info.currsize,
+        )
+    return report
+
+
+def reset_stats():
+    """Reset the hit, miss and eviction counts of every cached operation.
+
+    Cached entries are kept. The counts of `functools.lru_cache` wrapped functions can
+    only be reset together with their entries, so they are not affected.
+    """
+    for counters in _operation_counters.values():
+        counters[:] = [0, 0, 0]
+
+
+@contextmanager
+def measure(with_bytes: bool = False) -> Iterator[Dict[str, CacheStats]]:
+    """Context manager scoping cache statistics to a block of code.
+
+    The yielded dictionary is empty inside the block and is filled on exit with the
+    difference between the statistics after and before the block, for the operations
+    that were used.
+
+    Example:
+        >>> with measure() as scoped:
+        ...     curve.multiply_point(k, curve.G)
+        >>> scoped["EllipticCurveOperations.multiply_point"].misses
+        1
+
+    Args:
+        with_bytes (bool): If True, also report the difference in estimated bytes.
+            The estimation walks every cached entry twice, before and after the block,
+            which can cost far more than the block itself. Defaults to False.
+
+    Yields:
+        Dict[str, CacheStats]: The statistics of the block, keyed by operation.
+    """
+    before = stats(with_bytes)
+    scoped: Dict[str, CacheStats] = {}
+    try:
+        yield scoped
+    finally:
+        for name, after in stats(with_bytes).items():
+            delta = after - before.get(name, CacheStats())
+            if delta.hits or delta.misses or delta.evictions or delta.size:
+                scoped[name] = delta
@@ -0,0 +1,318 @@
+"""Random-access binary container for the encoded chunks of lengthy Koblitz messages.
+
+`Koblitz.encode` with ``lengthy=True`` returns the encoded chunks of a message as a tuple
+of ``(point, j)`` pairs, which has to be kept, or rebuilt, as a whole. A container stores
+the pairs in a file instead, one fixed-width record per chunk, so that any range of
+chunks can be read and decoded without touching the others, and new chunks can be
+appended without re-encoding the ones already stored.
+
+A container file holds a fixed-size header followed by the records:
+
+- the magic ``b"ECKB"``, the format version, the byte width of a coordinate, the number
+  of characters per chunk, the alphabet size and the curve name, NUL-padded to 32 bytes
+  (little-endian);
+- for each chunk, in message order, its point in compressed SEC1 form (see
+  `EllipticCurve.encode_point`) followed by one byte for `j`.
+
+Since every record has the same width, the offset of chunk ``i`` is
+``HEADER.size + i * record_size`` and no separate index is stored. Files are
+memory-mapped for reading. Decoding a chunk only needs the x coordinate, so ranges are
+decoded without decompressing their points.
+"""
+
+import io
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from ecutils.algorithms import Koblitz
+from ecutils.core import Point
+
+MAGIC = b"ECKB"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHHI32s")
+
+
+class KoblitzContainer:
+    """A file of encoded Koblitz chunks with random access and appends.
+
+    Containers are opened like files: mode ``"r"`` reads an existing container, ``"w"``
+    creates a new one, replacing any existing file, and ``"a"`` appends to an existing
+    container or creates it. They are context managers and should be closed after use.
+
+    Example:
+        >>> with KoblitzContainer("message.eckb", "w", curve_name="secp521r1") as container:
+        ...     container.write(reader)
+        >>> with KoblitzContainer("message.eckb") as container:
+        ...     container.decode(5000, 5010)
+
+    Attributes:
+        path (str): The path of the file.
+        koblitz (Koblitz): The encoder of the chunks, using the curve of the container.
+        alphabet_size (int): The alphabet size the chunks are encoded with.
+        chunk_size (int): The number of characters per chunk, see `Koblitz.chunk_size`.
+            When the container holds a single message, chunk ``i`` holds the characters
+            ``i * chunk_size`` to ``(i + 1) * chunk_size`` of it.
+        record_size (int): The number of bytes per chunk in the file.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        mode: str = "r",
+        curve_name: Optional[str] = None,
+        alphabet_size: Optional[int] = None,
+        koblitz: Optional[Koblitz] = None,
+    ):
+        """Opens or creates a container.
+
+        Args:
+            path (Union[str, os.PathLike]): The path of the file.
+            mode (str, optional): ``"r"``, ``"w"`` or ``"a"``. Defaults to ``"r"``.
+            curve_name (Optional[str], optional): The curve of a new container, and the
+                expected curve of an existing one. Defaults to the curve of `koblitz`, or
+                to 'secp521r1'.
+            alphabet_size (Optional[int], optional): The alphabet size of a new container,
+                and the expected alphabet size of an existing one. Defaults to 2**8.
+            koblitz (Optional[Koblitz], optional): The `Koblitz` instance used to encode
+                and decode, e.g. one with an injected executor. Defaults to a new
+                instance for the curve of the container.
+
+        Raises:
+            ValueError: If the mode is invalid, if `curve_name` and `koblitz` are on
+                different curves, if the file is not a container, or if it does not match
+                `curve_name`, `alphabet_size` or `koblitz`.
+        """
+        if mode not in ("r", "w", "a"):
+            raise ValueError("The mode must be 'r', 'w' or 'a'.")
+        if koblitz is not None:
+            if curve_name is None:
+                curve_name = koblitz.curve_name
+            elif curve_name != koblitz.curve_name:
+                raise ValueError(
+                    f"The curve name {curve_name!r} does not match the curve of the "
+                    f"Koblitz instance, {koblitz.curve_name!r}."
+                )
+
+        self.path = os.fspath(path)
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._writable = mode != "r"
+
+        if mode == "w" or (mode == "a" and not os.path.exists(self.path)):
+            self._create(curve_name or "secp521r1", alphabet_size or 2**8, koblitz)
+        else:
+            self._file = open(self.path, "rb" if mode == "r" else "r+b")
+            try:
+                self._read_header(curve_name, alphabet_size, koblitz)
+            except BaseException:
+                self.close()
+                raise
+        records = os.fstat(self._file.fileno()).st_size - HEADER.size
+        self._count = records // self.record_size
+
+    def _create(self, curve_name: str, alphabet_size: int, koblitz: Optional[Koblitz]):
+        self._set_layout(koblitz or Koblitz(curve_name), alphabet_size)
+        name = curve_name.encode()
+        if len(name) > 32:
+            raise ValueError("Curve names of containers are at most 32 bytes long.")
+        header = HEADER.pack(
+            MAGIC,
+            FORMAT_VERSION,
+            self.koblitz.curve.coordinate_size,
+            self.chunk_size,
+            alphabet_size,
+            name,
+        )
+        self._file = open(self.path, "w+b")
+        self._file.write(header)
+        self._file.flush()
+
+    def _read_header(
+        self,
+        curve_name: Optional[str],
+        alphabet_size: Optional[int],
+        koblitz: Optional[Koblitz],
+    ):
+        data = self._file.read(HEADER.size)
+        if len(data) < HEADER.size:
+            raise ValueError("Truncated container file.")
+        magic, version, size, chunk_size, stored_alphabet, name = HEADER.unpack(data)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("The file is not a Koblitz container of this version.")
+        stored_curve = name.rstrip(b"\x00").decode()
+        if curve_name is not None and curve_name != stored_curve:
+            raise ValueError(f"The container holds chunks of {stored_curve}.")
+        if alphabet_size is not None and alphabet_size != stored_alphabet:
+            raise ValueError(
+                f"The container holds chunks of alphabet size {stored_alphabet}."
+            )
+
+        self._set_layout(koblitz or Koblitz(stored_curve), stored_alphabet)
+        if (size, chunk_size) != (self.koblitz.curve.coordinate_size, self.chunk_size):
+            raise ValueError("The container does not match the parameters of its curve.")
+
+    def _set_layout(self, koblitz: Koblitz, alphabet_size: int):
+        self.koblitz = koblitz
+        self.alphabet_size = alphabet_size
+        self.chunk_size = koblitz.chunk_size(alphabet_size)
+        self.record_size = koblitz.curve.coordinate_size + 2
+
+    def __enter__(self) -> "KoblitzContainer":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(path={self.path!r}, "
+            f"curve_name={self.koblitz.curve_name!r}, chunks={len(self)})"
+        )
+
+    def close(self):
+        """Closes the file. Calling it more than once has no effect."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _records(self) -> mmap.mmap:
+        if self._file is None:
+            raise ValueError("I/O operation on a closed container.")
+        if self._map is None:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def _range(self, start: int, stop: Optional[int]) -> range:
+        return range(*slice(start, stop).indices(self._count))
+
+    def _coordinates(
+        self, start: int, stop: Optional[int]
+    ) -> Iterator[Tuple[int, bool, int]]:
+        records = self._records()
+        size, record_size = self.koblitz.curve.coordinate_size, self.record_size
+        from_bytes = int.from_bytes
+        for index in self._range(start, stop):
+            offset = HEADER.size + index * record_size
+            yield (
+                from_bytes(records[offset + 1 : offset + 1 + size], "big"),
+                records[offset] == 3,
+                records[offset + 1 + size],
+            )
+
+    def chunks(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[Tuple[Point, int]]:
+        """Iterates over a range of encoded chunks.
+
+        Args:
+            start (int, optional): The index of the first chunk. Defaults to 0.
+            stop (Optional[int], optional): The index after the last chunk. Defaults to
+                the number of chunks. Negative indices count from the end, as in slices.
+
+        Yields:
+            Tuple[Point, int]: The encoded point and the auxiliary value `j` of each
+                chunk.
+        """
+        curve = self.koblitz.curve
+        size = curve.coordinate_size
+        for x, odd, j in self._coordinates(start, stop):
+            prefix = b"\x03" if odd else b"\x02"
+            yield curve.decode_point(prefix + x.to_bytes(size, "big")), j
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Tuple[Point, int], List[Tuple[Point, int]]]:
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                raise ValueError("Containers only support contiguous slices.")
+            return list(self.chunks(index.start or 0, index.stop))
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Container index out of range.")
+        return next(self.chunks(index, index + 1))
+
+    def decode(self, start: int = 0, stop: Optional[int] = None) -> str:
+        """Decodes a range of chunks, reading only their records.
+
+        Args:
+            start (int, optional): The index of the first chunk. Defaults to 0.
+            stop (Optional[int], optional): The index after the last chunk. Defaults to
+                the number of chunks. Negative indices count from the end, as in slices.
+
+        Returns:
+            str: The decoded characters of the chunks.
+        """
+        decode = self.koblitz.decode_coordinate
+        alphabet_size = self.alphabet_size
+        return "".join(
+            decode(x, j, alphabet_size) for x, _, j in self._coordinates(start, stop)
+        )
+
+    def append(self, encoded: Iterable[Tuple[Point, int]]) -> int:
+        """Appends encoded chunks to the container, without rewriting the others.
+
+        Args:
+            encoded (Iterable[Tuple[Point, int]]): The encoded points and their auxiliary
+                values `j`, as returned by `Koblitz.encode` with ``lengthy=True`` or by
+                `Koblitz.encode_stream`.
+
+        Returns:
+            int: The number of chunks appended.
+
+        Raises:
+            ValueError: If the container is read-only, or if a pair is not an encoded
+                chunk of the curve of the container.
+        """
+        if self._file is None:
+            raise ValueError("I/O operation on a closed container.")
+        if not self._writable:
+            raise ValueError("The container is opened read-only.")
+        curve = self.koblitz.curve
+        point_size = self.record_size - 1
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+        # Drop a record torn by an interrupted append before writing after it
+        file = self._file
+        file.seek(HEADER.size + self._count * self.record_size)
+        file.truncate()
+        appended = 0
+        try:
+            for point, j in encoded:
+                if point.x is None or point.y is None or not 0 <= j < 256:
+                    raise ValueError("Invalid encoded chunk.")
+                data = curve.encode_point(curve.validate_point(point))
+                # A record of another width would shift every record after it
+                if len(data) != point_size:
+                    raise ValueError("Invalid encoded chunk.")
+                file.write(data + bytes((j,)))
+                appended += 1
+        finally:
+            file.flush()
+            self._count += appended
+        return appended
+
+    def write(self, message: Union[str, TextIO]) -> int:
+        """Encodes a message, or the text of a reader, and appends its chunks.
+
+        The message is encoded with `Koblitz.encode_stream`, so a reader is read one
+        batch of chunks at a time, and its chunks are written as they are encoded.
+
+        Args:
+            message (Union[str, TextIO]): The message, or a text file-like object.
+
+        Returns:
+            int: The number of chunks appended.
+        """
+        reader = io.StringIO(message) if isinstance(message, str) else message
+        return self.append(self.koblitz.encode_stream(reader, self.alphabet_size))
@@ -0,0 +1,224 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class MersennePrime(int):
+    """A Mersenne prime ``2**k - 1`` whose modular reduction uses shift-and-add folding.
+
+    Since ``2**k = 1 (mod p)``, the high bits of a number can be folded onto its low bits
+    with a shift, a mask and an addition, which is much cheaper than CPython's generic
+    long division for the double-length products that arise in field multiplication.
+    Instances behave exactly like the plain `int` they wrap; only ``x % p`` is
+    specialized, through `__rmod__`, which Python tries first because `MersennePrime`
+    is a subclass of `int`.
+    """
+
+    __slots__ = ()
+
+    def __rmod__(self, x: int) -> int:
+        x = (x & self) + (x >> self.bit_length())
+        if 0 <= x < self:
+            return x
+        return int.__mod__(x, self)
+
+    def __repr__(self) -> str:
+        return int.__repr__(self)
+
+
+def fast_modulus(p: int) -> int:
+    """Select the modular reduction strategy for a prime field.
+
+    Args:
+        p (int): The prime order of the finite field.
+
+    Returns:
+        int: `p` as a `MersennePrime` if it has the form ``2**k - 1``, such as the
+            secp521r1 prime, otherwise `p` unchanged so that reductions use the
+            built-in ``%``. Measurements with ``benchmarks/reduction.py`` show that
+            folding the other generalized-Mersenne primes of the named curves in pure
+            Python is not faster than the built-in reduction.
+    """
+    if p > 2 and p & (p + 1) == 0:
+        return MersennePrime(p)
+    return p
+
+
+def jacobi_symbol(a: int, n: int) -> int:
+    """Compute the Jacobi symbol ``(a / n)`` with the binary algorithm.
+
+    Factors of two are stripped with a shift and the quadratic reciprocity law swaps
+    the arguments, so the cost is that of a Euclidean algorithm instead of the modular
+    exponentiation of Euler's criterion, several times cheaper on the named curves.
+
+    Args:
+        a (int): The integer to test.
+        n (int): A positive odd modulus, typically the prime of a curve.
+
+    Returns:
+        int: 0 if `a` and `n` are not coprime, otherwise 1 or -1. For a prime `n`, 1 means
+            that `a` is a non-zero quadratic residue modulo `n` and -1 that it is not.
+
+    Raises:
+        ValueError: If `n` is not a positive odd integer.
+    """
+    if n <= 0 or not n & 1:
+        raise ValueError("The modulus must be a positive odd integer.")
+    a %= n
+    result = 1
+    while a:
+        # (2 / n) = -1 exactly when n = 3 or 5 (mod 8)
+        twos = (a & -a).bit_length() - 1
+        a >>= twos
+        if twos & 1 and n & 7 in (3, 5):
+            result = -result
+        # Reciprocity: the sign flips when both are 3 (mod 4)
+        if a & n & 2:
+            result = -result
+        a, n = n % a, a
+    return result if n == 1 else 0
+
+
+class ModularSquareRoot:
+    """Square roots modulo an odd prime, with the constants of the prime precomputed.
+
+    Writing ``p - 1 = 2**s * q`` with `q` odd, the root of a square `a` is
+    ``x = a**((q + 1) / 2)`` corrected by a power of ``g = z**q``, where `z` is a
+    quadratic non-residue and `g` generates the subgroup of order ``2**s``:
+
+    - if ``p = 3 (mod 4)``, that is ``s = 1``, ``x`` is the root and one exponentiation
+      is all it takes;
+    - otherwise ``t = a**q`` lies in that subgroup, and the discrete logarithm ``e`` of
+      `t` to the base `g` gives the root ``x * g**(-e / 2)``. Tonelli-Shanks recovers
+      `e` one bit at a time with ``O(s**2)`` squarings, which dominates on primes with a
+      large `s` such as the secp224r1 prime (``s = 96``). Here `e` is recovered `window`
+      bits at a time, from tables of powers of `g` computed once, for ``s`` squarings
+      and about ``(s / window)**2 / 2`` multiplications.
+
+    The non-residue, the decomposition of ``p - 1``, the exponent and the tables are
+    computed once, on construction.
+
+    Attributes:
+        p (int): The prime.
+        s (int): The exponent of the largest power of two dividing ``p - 1``.
+        q (int): The odd part of ``p - 1``.
+        non_residue (int): The smallest quadratic non-residue modulo `p`.
+        window (int): The number of bits of the discrete logarithm found per step, at
+            most `s`. Defaults to 6; larger windows trade larger tables for fewer
+            multiplications.
+    """
+
+    __slots__ = (
+        "p",
+        "s",
+        "q",
+        "non_residue",
+        "window",
+        "_exponent",
+        "_root_of_unity",
+        "_windows",
+        "_logarithms",
+        "_inverse_powers",
+    )
+
+    def __init__(self, p: int, window: int = 6):
+        if p < 3 or not p & 1:
+            raise ValueError("The modulus must be an odd prime.")
+        p = int(p)
+        q, s = p - 1, 0
+        while not q & 1:
+            q >>= 1
+            s += 1
+        non_residue = next(z for z in range(2, p) if jacobi_symbol(z, p) == -1)
+
+        self.p, self.s, self.q = p, s, q
+        self.non_residue = non_residue
+        self.window = min(window, s)
+        # With s = 1, (p + 1) / 4 is the exponent of the root itself
+        self._exponent = (p + 1) // 4 if s == 1 else (q - 1) // 2
+        self._root_of_unity = g = pow(non_residue, q, p)
+
+        # The logarithm is split in windows of `window` bits, the last one shorter if
+        # needed. Window l covers bits `offset` to `offset + width` and is read from
+        # (t * g**(-e_low))**(2**(s - offset - width)), where e_low holds the bits of
+        # the previous windows.
+        self._windows: List[Tuple[int, int]] = [
+            (offset, min(self.window, s - offset)) for offset in range(0, s, self.window)
+        ]
+        self._logarithms: Dict[int, Dict[int, int]] = {}
+        self._inverse_powers: Dict[int, List[int]] = {}
+        g_inverse = pow(g, -1, p)
+        for index, (offset, width) in enumerate(self._windows):
+            if width not in self._logarithms:
+                h = pow(g, 1 << (s - width), p)
+                self._logarithms[width] = {pow(h, d, p): d for d in range(1 << width)}
+            for previous, _ in self._windows[:index]:
+                position = previous + s - offset - width
+                if position not in self._inverse_powers:
+                    base = pow(g_inverse, 1 << position, p)
+                    powers = [1]
+                    for _ in range((1 << self.window) - 1):
+                        powers.append(powers[-1] * base % p)
+                    self._inverse_powers[position] = powers
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(p={hex(self.p)})"
+
+    def sqrt(self, a: int) -> Optional[int]:
+        """Compute a square root of `a` modulo `p`.
+
+        Args:
+            a (int): The integer whose square root is computed.
+
+        Returns:
+            Optional[int]: A root ``y`` in ``[0, p)`` with ``y * y = a (mod p)``, or None if
+                `a` is not a square modulo `p`. The other root is ``p - y``.
+        """
+        p = self.p
+        a %= p
+        if a == 0:
+            return 0
+        if self.s == 1:
+            x = pow(a, self._exponent, p)
+            return x if x * x % p == a else None
+        w = pow(a, self._exponent, p)
+        x = a * w % p
+        t = x * w % p
+
+        # Powers t**(2**i) for every i, shared by all windows
+        t_powers = [t]
+        for _ in range(self.s - 1):
+            t = t * t % p
+            t_powers.append(t)
+
+        s = self.s
+        e = 0
+        digits = []
+        for offset, width in self._windows:
+            shift = s - offset - width
+            u = t_powers[shift]
+            for previous, digit in digits:
+                if digit:
+                    u = u * self._inverse_powers[previous + shift][digit] % p
+            digit = self._logarithms[width][u]
+            digits.append((offset, digit))
+            e |= digit << offset
+
+        if e & 1:
+            return None
+        return x * pow(self._root_of_unity, (1 << s) - (e >> 1), p) % p
+
+    def sqrt_batch(self, values: Iterable[int]) -> List[Optional[int]]:
+        """Compute square roots of many integers modulo `p`.
+
+        Non-squares are detected with the Jacobi symbol, which is much cheaper than the
+        exponentiation they would otherwise cost.
+
+        Args:
+            values (Iterable[int]): The integers whose square roots are computed.
+
+        Returns:
+            List[Optional[int]]: The roots in the order of `values`, as returned by
+                `sqrt`, with None for the integers that are not squares modulo `p`.
+        """
+        p = self.p
+        sqrt = self.sqrt
+        return [None if jacobi_symbol(a, p) < 0 else sqrt(a) for a in values]
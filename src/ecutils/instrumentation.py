@@ -0,0 +1,374 @@
+"""Opt-in counters of the field and point operations performed by ecutils.
+
+When enabled, the point formulas and the square roots of `EllipticCurveOperations` are
+temporarily wrapped so that every evaluation adds its field multiplications, squarings
+and inversions to a counter, together with the number of point doublings, point
+additions, on-curve checks, square roots and Jacobi symbols. Counts are aggregated per
+curve and per high-level call (`multiply_point`, `multiply_add`,
+`multi_scalar_multiply`, `DigitalSignature.generate_signature`,
+`DigitalSignature.verify_signature` and `Koblitz.encode`). When disabled, the original
+methods are restored and the counters cost nothing.
+
+Only the work done in the current process is counted: cached results cost nothing, and
+the chunks of lengthy Koblitz messages encoded by worker processes are not counted.
+"""
+
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, fields
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ecutils.cache import cached
+from ecutils.core import EllipticCurveOperations
+
+UNSCOPED = "<unscoped>"
+
+
+@dataclass
+class OperationCounts:
+    """Counts of the operations performed on one curve during one kind of call.
+
+    Attributes:
+        multiplications (int): Field multiplications, excluding squarings.
+        squarings (int): Field squarings.
+        inversions (int): Modular inversions in the field.
+        doublings (int): Point doublings.
+        additions (int): Point additions, including mixed and co-Z additions.
+        on_curve_checks (int): Evaluations of the curve equation.
+        square_roots (int): Square roots modulo the prime, whose exponentiations are
+            included in the multiplications and squarings.
+        jacobi_symbols (int): Quadratic residuosity tests with the Jacobi symbol.
+    """
+
+    multiplications: int = 0
+    squarings: int = 0
+    inversions: int = 0
+    doublings: int = 0
+    additions: int = 0
+    on_curve_checks: int = 0
+    square_roots: int = 0
+    jacobi_symbols: int = 0
+
+    def add(self, other: "OperationCounts"):
+        """Add the counts of `other` to these counts."""
+        for field in fields(self):
+            setattr(
+                self, field.name, getattr(self, field.name) + getattr(other, field.name)
+            )
+
+
+# Formula costs in the order of the fields of OperationCounts, trailing zeros omitted
+Cost = Tuple[int, ...]
+
+_counts: Dict[Tuple[str, str], OperationCounts] = {}
+_curve_names: Dict[int, str] = {}
+_current_call: ContextVar[Optional[str]] = ContextVar("ecutils_current_call", default=None)
+_originals: List[Tuple[Any, str, Any]] = []
+
+
+def _is_finite(p: Any) -> bool:
+    return p.x is not None and p.y is not None
+
+
+def _doubling_cost(curve: EllipticCurveOperations) -> Cost:
+    if curve.a_is_minus_three:
+        return 3, 5, 0, 1, 0, 0
+    if curve.a_is_zero:
+        return 2, 5, 0, 1, 0, 0
+    return 4, 6, 0, 1, 0, 0
+
+
+def _double_cost(curve: EllipticCurveOperations, p: Any) -> Optional[Cost]:
+    if not _is_finite(p) or p.y == 0:
+        return None
+    return _doubling_cost(curve)
+
+
+def _schedule_cost(
+    curve: EllipticCurveOperations, schedule: Any, double: bool = True
+) -> Optional[Cost]:
+    # The accumulator is doubled after the first non-empty step, and the first
+    # addition only loads a point into the accumulator
+    steps = [len(step) for step in schedule]
+    first = next((i for i, added in enumerate(steps) if added), None)
+    if first is None:
+        return None
+    doublings = len(steps) - 1 - first if double else 0
+    additions = sum(steps) - 1
+    m, s, _, _, _, _ = _doubling_cost(curve)
+    return (
+        doublings * m + additions * 7,
+        doublings * s + additions * 4,
+        0,
+        doublings,
+        additions,
+        0,
+    )
+
+
+def _add_cost(curve: EllipticCurveOperations, p1: Any, p2: Any) -> Optional[Cost]:
+    # Additions with a z = 1 operand are counted by jacobian_add_mixed_points
+    if not _is_finite(p1) or not _is_finite(p2) or p1.z == 1 or p2.z == 1:
+        return None
+    p = curve.p
+    z1z1, z2z2 = p1.z * p1.z % p, p2.z * p2.z % p
+    if p1.x * z2z2 % p == p2.x * z1z1 % p:
+        # Equal x coordinates stop the formula, any doubling is counted on its own
+        return 6, 2
+    return 11, 5, 0, 0, 1
+
+
+def _add_mixed_cost(curve: EllipticCurveOperations, p1: Any, p2: Any) -> Optional[Cost]:
+    if not _is_finite(p1) or not _is_finite(p2):
+        return None
+    p = curve.p
+    if (p2.x * p1.z * p1.z - p1.x) % p == 0:
+        # Equal x coordinates stop the formula, any doubling is counted on its own
+        return 3, 1
+    return 7, 4, 0, 0, 1
+
+
+def _exponentiation_cost(e: int) -> Tuple[int, int]:
+    # Square-and-multiply: a squaring per bit after the first, a multiplication per
+    # further set bit
+    return bin(e).count("1") - 1, e.bit_length() - 1
+
+
+def _sqrt_cost(curve: EllipticCurveOperations, a: int) -> Optional[Cost]:
+    root = curve.square_root
+    if a % root.p == 0:
+        return 0, 0, 0, 0, 0, 0, 1
+    if root.s == 1:
+        # One exponentiation, and the squaring that checks the root
+        m, s = _exponentiation_cost((root.p + 1) // 4)
+        return m, s + 1, 0, 0, 0, 0, 1
+    # The Tonelli-Shanks correction depends on the digits of a discrete logarithm, so
+    # it is counted at its worst case: a multiplication per pair of windows, and an
+    # exponentiation of at most `s` bits for the correcting power
+    m, s = _exponentiation_cost((root.q - 1) // 2)
+    windows = -(-root.s // root.window)
+    m += 2 + windows * (windows - 1) // 2 + root.s
+    s += 2 * root.s - 1
+    return m, s, 0, 0, 0, 0, 1
+
+
+def _to_affine_cost(curve: EllipticCurveOperations, point: Any) -> Optional[Cost]:
+    if not _is_finite(point) or point.z == 0:
+        return None
+    return 3, 2, 1, 0, 0, 0
+
+
+def _to_affine_batch_cost(curve: EllipticCurveOperations, points: Any) -> Optional[Cost]:
+    finite = sum(1 for p in points if _is_finite(p) and p.z % curve.p != 0)
+    if not finite:
+        return None
+    return 6 * finite, finite, 1, 0, 0, 0
+
+
+def _on_curve_cost(curve: EllipticCurveOperations, p: Any) -> Optional[Cost]:
+    if not _is_finite(p):
+        return None
+    return 2, 2, 0, 0, 0, 1
+
+
+def _affine_add_cost(curve: EllipticCurveOperations, p1: Any, p2: Any) -> Optional[Cost]:
+    # Doublings are counted by affine_double_point
+    if not _is_finite(p1) or not _is_finite(p2) or p1 == p2:
+        return None
+    return 2, 1, 1, 0, 1, 0
+
+
+def _affine_double_cost(curve: EllipticCurveOperations, p: Any) -> Optional[Cost]:
+    if not _is_finite(p):
+        return None
+    return 2, 2, 1, 1, 0, 0
+
+
+FORMULA_COSTS: Dict[str, Callable[..., Optional[Cost]]] = {
+    "affine_add_points": _affine_add_cost,
+    "affine_double_point": _affine_double_cost,
+    "jacobian_add_points": _add_cost,
+    "jacobian_add_mixed_points": _add_mixed_cost,
+    "jacobian_double_point": _double_cost,
+    "jacobian_evaluate_schedule": _schedule_cost,
+    "jacobian_co_z_double": lambda curve, p: (2, 4, 0, 1, 0, 0),
+    "jacobian_co_z_add": lambda curve, p1, p2: (5, 2, 0, 0, 1, 0),
+    "jacobian_co_z_add_conjugate": lambda curve, p1, p2: (6, 3, 0, 0, 1, 0),
+    "to_affine": _to_affine_cost,
+    "to_affine_batch": _to_affine_batch_cost,
+    "is_point_on_curve": _on_curve_cost,
+    "sqrt_mod_p": _sqrt_cost,
+    "is_square_mod_p": lambda curve, a: (0, 0, 0, 0, 0, 0, 0, 1),
+}
+
+CURVE_CALLS = ("multiply_point", "multiply_add", "multi_scalar_multiply")
+
+
+def curve_label(curve: Any) -> str:
+    """Return the name of a named curve, or a label identifying a custom curve."""
+    label = _curve_names.get(id(curve))
+    if label is None:
+        from ecutils import curves
+
+        # Standard curves are compared by their parameters, so none of them is built,
+        # and registered curves, which are built already, by equality
+        parameters = (curve.p, curve.a, curve.b, curve.G.x, curve.G.y, curve.n, curve.h)
+        label = next(
+            (
+                name
+                for name, named in curves.CURVE_PARAMETERS.items()
+                if parameters
+                == (
+                    named["p"],
+                    named["a"],
+                    named["b"],
+                    named["G"]["x"],
+                    named["G"]["y"],
+                    named["n"],
+                    named["h"],
+                )
+            ),
+            None,
+        ) or next(
+            (
+                name
+                for name in curves.names()
+                if name not in curves.CURVE_PARAMETERS and curves.get(name) == curve
+            ),
+            f"custom(p={hex(curve.p)})",
+        )
+        _curve_names[id(curve)] = label
+        weakref.finalize(curve, _curve_names.pop, id(curve), None)
+    return label
+
+
+def _record(curve: Any, cost: Cost):
+    key = (curve_label(curve), _current_call.get() or UNSCOPED)
+    counts = _counts.get(key)
+    if counts is None:
+        counts = _counts[key] = OperationCounts()
+    counts.add(OperationCounts(*cost))
+
+
+def _counting(func: Callable, cost: Callable[..., Optional[Cost]]) -> Callable:
+    @wraps(func)
+    def wrapper(curve, *args, **kwargs):
+        spent = cost(curve, *args, **kwargs)
+        if spent is not None:
+            _record(curve, spent)
+        return func(curve, *args, **kwargs)
+
+    return wrapper
+
+
+def _scoping(method: Any, label: str) -> Callable:
+    @wraps(getattr(method, "func", method))
+    def wrapper(self, *args, **kwargs):
+        if _current_call.get() is not None:
+            return method.__get__(self, type(self))(*args, **kwargs)
+        token = _current_call.set(label)
+        try:
+            return method.__get__(self, type(self))(*args, **kwargs)
+        finally:
+            _current_call.reset(token)
+
+    return wrapper
+
+
+def _patch(owner: Any, name: str, replacement: Any):
+    original = owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name)
+    _originals.append((owner, name, original))
+    setattr(owner, name, replacement)
+
+
+def is_enabled() -> bool:
+    """Return True if the operation counters are enabled."""
+    return bool(_originals)
+
+
+def enable():
+    """Start counting operations. Calling it while enabled has no effect."""
+    if is_enabled():
+        return
+
+    from ecutils.algorithms import DigitalSignature, Koblitz
+
+    for name, cost in FORMULA_COSTS.items():
+        attribute = EllipticCurveOperations.__dict__[name]
+        if isinstance(attribute, cached):
+            # Count inside the cache, so that cache hits cost nothing
+            _patch(attribute, "func", _counting(attribute.func, cost))
+        else:
+            _patch(EllipticCurveOperations, name, _counting(attribute, cost))
+
+    for owner, names in (
+        (EllipticCurveOperations, CURVE_CALLS),
+        (DigitalSignature, ("generate_signature", "verify_signature")),
+        (Koblitz, ("encode",)),
+    ):
+        for name in names:
+            method = owner.__dict__[name]
+            _patch(owner, name, _scoping(method, f"{owner.__name__}.{name}"))
+
+
+def disable():
+    """Stop counting operations and restore the original methods. Counts are kept."""
+    while _originals:
+        owner, name, original = _originals.pop()
+        setattr(owner, name, original)
+
+
+def reset():
+    """Discard all counts."""
+    _counts.clear()
+
+
+def counts() -> Dict[Tuple[str, str], OperationCounts]:
+    """Return a copy of the counts.
+
+    Returns:
+        Dict[Tuple[str, str], OperationCounts]: The counts keyed by curve name and by the
+            qualified name of the outermost high-level call, such as
+            ``("secp256r1", "DigitalSignature.verify_signature")``. Operations performed
+            outside of those calls are keyed by `UNSCOPED`.
+    """
+    return {key: OperationCounts(**vars(value)) for key, value in _counts.items()}
+
+
+@contextmanager
+def count_operations() -> Iterator[Dict[Tuple[str, str], OperationCounts]]:
+    """Context manager counting the operations performed in a block of code.
+
+    Counting is enabled for the duration of the block, restoring the previous state on
+    exit. The yielded dictionary is filled on exit with the counts of the block only,
+    in the format returned by `counts`.
+
+    Example:
+        >>> with count_operations() as spent:
+        ...     signer.generate_signature(message_hash)
+        >>> spent["secp192k1", "DigitalSignature.generate_signature"].doublings
+        0
+
+    Yields:
+        Dict[Tuple[str, str], OperationCounts]: The counts of the block.
+    """
+    was_enabled = is_enabled()
+    before = counts()
+    scoped: Dict[Tuple[str, str], OperationCounts] = {}
+    enable()
+    try:
+        yield scoped
+    finally:
+        if not was_enabled:
+            disable()
+        for key, after in counts().items():
+            spent = OperationCounts(
+                **{
+                    name: value - getattr(before.get(key, OperationCounts()), name)
+                    for name, value in vars(after).items()
+                }
+            )
+            if any(vars(spent).values()):
+                scoped[key] = spent
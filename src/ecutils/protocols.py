@@ -1,9 +1,8 @@
 from dataclasses import dataclass
-from functools import lru_cache
 
+from ecutils.cache import cached
 from ecutils.core import EllipticCurve, Point
 from ecutils.curves import get as get_curve
-from ecutils.settings import LRU_CACHE_MAXSIZE
 
 
 @dataclass(frozen=True)
@@ -19,7 +18,7 @@ class DiffieHellman:
     curve_name: str = "secp192k1"
 
     @property
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def curve(self) -> EllipticCurve:
         """Retrieves the elliptic curve associated with this `DiffieHellman` instance.
 
@@ -33,7 +32,7 @@ class DiffieHellman:
         return get_curve(self.curve_name)
 
     @property
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def public_key(self) -> Point:
         """Computes and returns the public key corresponding to the private key.
 
@@ -49,7 +48,7 @@ class DiffieHellman:
         """
         return self.curve.multiply_point(self.private_key, self.curve.G)
 
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def compute_shared_secret(self, other_public_key: Point) -> Point:
         """Computes the shared secret using the private key and the other party's public key.
 
@@ -58,6 +57,9 @@ class DiffieHellman:
 
         Returns:
             Point: The resulting shared secret as a point on the elliptic curve.
+
+        Raises:
+            ValueError: If the other party's public key is not on the elliptic curve.
         """
 
         return self.curve.multiply_point(self.private_key, other_public_key)
@@ -76,7 +78,7 @@ class MasseyOmura:
     curve_name: str = "secp192k1"
 
     @property
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def curve(self) -> EllipticCurve:
         """Retrieves the elliptic curve associated with this `MasseyOmura` instance.
 
@@ -90,7 +92,7 @@ class MasseyOmura:
         return get_curve(self.curve_name)
 
     @property
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def public_key(self) -> Point:
         """Computes and returns the public key corresponding to the private key.
 
@@ -106,19 +108,19 @@ class MasseyOmura:
         """
         return self.curve.multiply_point(self.private_key, self.curve.G)
 
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def first_encryption_step(self, message: Point) -> Point:
         """Encrypts the message with the sender's private key."""
 
         return self.curve.multiply_point(self.private_key, message)
 
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def second_encryption_step(self, received_encrypted_message: Point) -> Point:
         """Applies the receiver's private key on the received encrypted message."""
 
         return self.first_encryption_step(received_encrypted_message)
 
-    @lru_cache(maxsize=LRU_CACHE_MAXSIZE, typed=True)
+    @cached
     def partial_decryption_step(self, encrypted_message: Point) -> Point:
         """Partial decryption using the inverse of the sender's private key."""
 
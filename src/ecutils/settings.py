@@ -1,4 +1,8 @@
 import os
+from typing import Optional
 
 # Default value for LRU cache maxsize
 LRU_CACHE_MAXSIZE: int = int(os.environ.get("LRU_CACHE_MAXSIZE", 1024))
+
+# Directory of the persistent precomputation tables, disabled when unset
+TABLE_DIR: Optional[str] = os.environ.get("ECUTILS_TABLE_DIR") or None
@@ -0,0 +1,221 @@
+"""Persistent store for the precomputed point tables of the curves.
+
+Building the generator tables of a large curve, such as secp521r1, takes thousands of
+point additions. When a table directory is configured, through the environment
+variable ``ECUTILS_TABLE_DIR`` or `set_table_dir`, each table is written once to a
+compact binary file and later loaded from it instead of being rebuilt.
+
+A table file holds a fixed-size header followed by fixed-width records:
+
+- the magic ``b"ECTB"``, the format version, the byte width of a coordinate, the
+  number of rows and the number of points per row (little-endian);
+- the SHA-256 digest of the curve parameters, the table kind and its window width;
+- the SHA-256 digest of the records;
+- for each point, in row order, its affine ``x`` and ``y`` coordinates as big-endian
+  integers of the coordinate width.
+
+The records are checked against their digest on load, so a corrupted file is rebuilt
+instead of yielding wrong points. Call `warm_up` before forking worker processes to pay
+the cost of building or loading the tables once, in the parent.
+"""
+
+import os
+import struct
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+from ecutils.settings import TABLE_DIR
+
+MAGIC = b"ECTB"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHHII32s32s")
+
+Rows = List[List[Tuple[int, int]]]
+
+_table_dir: Optional[str] = TABLE_DIR
+
+
+def set_table_dir(path: Optional[str]):
+    """Set the directory of the table files, or disable the store with None.
+
+    Args:
+        path (Optional[str]): The directory, created on first write if needed.
+    """
+    global _table_dir
+    _table_dir = os.fspath(path) if path is not None else None
+
+
+def get_table_dir() -> Optional[str]:
+    """Return the directory of the table files, or None if the store is disabled."""
+    return _table_dir
+
+
+def _sha256(data: Any) -> bytes:
+    # hashlib takes about a tenth of the import time budget of the package, and only
+    # the table store needs it, so it is imported on first use
+    import hashlib
+
+    return hashlib.sha256(data).digest()
+
+
+def table_key(curve: Any, kind: str, width: int) -> bytes:
+    """Return the digest identifying a table of a curve.
+
+    Args:
+        curve (EllipticCurve): The curve the table belongs to.
+        kind (str): The kind of table, such as ``"generator_table"``.
+        width (int): The window width of the table.
+
+    Returns:
+        bytes: The SHA-256 digest of the curve parameters and the table geometry.
+    """
+    parameters = (
+        FORMAT_VERSION,
+        int(curve.p),
+        curve.a,
+        curve.b,
+        curve.G.x,
+        curve.G.y,
+        curve.n,
+        curve.h,
+        kind,
+        width,
+    )
+    return _sha256(repr(parameters).encode())
+
+
+def table_path(curve: Any, kind: str, width: int) -> Optional[str]:
+    """Return the path of the file of a table, or None if the store is disabled."""
+    if _table_dir is None:
+        return None
+    key = table_key(curve, kind, width).hex()[:16]
+    return os.path.join(_table_dir, f"{kind}-w{width}-{key}.ectbl")
+
+
+def load(curve: Any, kind: str, width: int) -> Optional[Rows]:
+    """Load a table from its file.
+
+    Args:
+        curve (EllipticCurve): The curve the table belongs to.
+        kind (str): The kind of table.
+        width (int): The window width of the table.
+
+    Returns:
+        Optional[Rows]: The rows of affine ``(x, y)`` coordinates, or None if the store
+            is disabled, or if the file is missing, corrupted or does not match the
+            table.
+    """
+    path = table_path(curve, kind, width)
+    if path is None:
+        return None
+    try:
+        with open(path, "rb") as file:
+            return _decode(file.read(), table_key(curve, kind, width))
+    except (OSError, ValueError):
+        return None
+
+
+def save(curve: Any, kind: str, width: int, rows: Sequence[Sequence[Tuple[int, int]]]):
+    """Write a table to its file, if the store is enabled.
+
+    The file is written to a temporary file first and then renamed, so that concurrent
+    readers never see a partial table.
+
+    Args:
+        curve (EllipticCurve): The curve the table belongs to.
+        kind (str): The kind of table.
+        width (int): The window width of the table.
+        rows (Sequence[Sequence[Tuple[int, int]]]): The rows of affine coordinates, all
+            of the same length.
+    """
+    path = table_path(curve, kind, width)
+    if path is None:
+        return
+    size = (curve.p.bit_length() + 7) // 8
+    row_length = len(rows[0]) if rows else 0
+    key = table_key(curve, kind, width)
+    records = b"".join(
+        x.to_bytes(size, "big") + y.to_bytes(size, "big")
+        for row in rows
+        for x, y in row
+    )
+
+    import tempfile
+
+    checksum = _sha256(records)
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, size, len(rows), row_length, key, checksum
+    )
+
+    os.makedirs(_table_dir, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(dir=_table_dir, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(header + records)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def _decode(data: bytes, key: bytes) -> Rows:
+    if len(data) < HEADER.size:
+        raise ValueError("Truncated table file.")
+    header = HEADER.unpack_from(data)
+    magic, version, size, row_count, row_length, digest, checksum = header
+    if magic != MAGIC or version != FORMAT_VERSION or digest != key:
+        raise ValueError("The table file does not match the requested table.")
+    record = 2 * size
+    if len(data) != HEADER.size + row_count * row_length * record:
+        raise ValueError("Truncated table file.")
+    if _sha256(memoryview(data)[HEADER.size :]) != checksum:
+        raise ValueError("Corrupted table file.")
+
+    from_bytes = int.from_bytes
+    rows = []
+    offset = HEADER.size
+    for _ in range(row_count):
+        row = []
+        for _ in range(row_length):
+            row.append(
+                (
+                    from_bytes(data[offset : offset + size], "big"),
+                    from_bytes(data[offset + size : offset + record], "big"),
+                )
+            )
+            offset += record
+        rows.append(row)
+    return rows
+
+
+def warm_up(curves: Optional[Iterable[Any]] = None):
+    """Build or load the precomputed tables of some curves ahead of time.
+
+    The generator tables are otherwise built on the first multiplication that needs
+    them. With a table directory configured, tables missing from it are written to it,
+    including tables built before the directory was configured.
+
+    Args:
+        curves (Optional[Iterable[Union[str, EllipticCurve]]]): The curves, by name or
+            as `EllipticCurve` instances. Defaults to every named curve, including
+            the curves added with `ecutils.curves.register`.
+    """
+    from ecutils.curves import get as get_curve
+    from ecutils.curves import names
+
+    if curves is None:
+        curves = names()
+    for curve in curves:
+        if isinstance(curve, str):
+            curve = get_curve(curve)
+        curve.glv_parameters
+        for kind, width, rows in (
+            ("generator_table", curve.generator_window_width, curve.generator_table),
+            (
+                "generator_odd_multiples",
+                curve.generator_wnaf_window_width,
+                curve.generator_odd_multiples[:1],
+            ),
+        ):
+            path = table_path(curve, kind, width)
+            if path is not None and not os.path.exists(path):
+                save(curve, kind, width, [[(q.x, q.y) for q in row] for row in rows])
@@ -1,6 +1,7 @@
 import hashlib
 from functools import lru_cache
 
+from ecutils.cache import register_lru_cache
 from ecutils.settings import LRU_CACHE_MAXSIZE
 
 
@@ -32,3 +33,6 @@ def calculate_file_hash(file_name: str, block_size: int = 16384) -> int:
         return int(sha256_hash.hexdigest(), 16)
     except FileNotFoundError as e:
         raise FileNotFoundError(f"File not found: {file_name}") from e
+
+
+register_lru_cache("utils.calculate_file_hash", calculate_file_hash)
@@ -0,0 +1,201 @@
+import gc
+import os
+import subprocess
+import sys
+import unittest
+
+import ecutils
+from ecutils import cache
+from ecutils.cache import cached, configure, estimate_size, reset_config
+
+
+class Counter:
+    """Helper class whose cached method records every real call."""
+
+    def __init__(self):
+        self.calls = []
+
+    @cached
+    def square(self, x):
+        self.calls.append(x)
+        return x * x
+
+
+class TestCache(unittest.TestCase):
+    """Test cases for the per-instance method caches and their policies."""
+
+    def setUp(self):
+        # Independent of the LRU_CACHE_MAXSIZE default, which may disable caching
+        configure(policy="lru", maxsize=1024)
+
+    def tearDown(self):
+        reset_config()
+
+    def test_results_are_cached(self):
+        """Test that repeated calls with the same arguments are served from the cache."""
+        counter = Counter()
+        self.assertEqual(counter.square(3), 9)
+        self.assertEqual(counter.square(3), 9)
+        self.assertEqual(counter.square(x=3), 9)
+        self.assertEqual(counter.calls, [3, 3])
+
+    def test_instances_have_separate_partitions(self):
+        """Test that instances do not evict each other's entries."""
+        configure(maxsize=1)
+        first, second = Counter(), Counter()
+        first.square(2)
+        second.square(3)
+        first.square(2)
+        self.assertEqual(first.calls, [2])
+        self.assertEqual(second.calls, [3])
+
+    def test_lru_policy(self):
+        """Test that the least recently used entry is evicted first."""
+        configure(policy="lru", maxsize=2)
+        counter = Counter()
+        for x in (1, 2, 1, 3, 1, 2):
+            counter.square(x)
+        self.assertEqual(counter.calls, [1, 2, 3, 2])
+
+    def test_lfu_policy(self):
+        """Test that the least frequently used entry is evicted first."""
+        configure(policy="lfu", maxsize=2)
+        counter = Counter()
+        for x in (1, 1, 2, 3, 1, 2):
+            counter.square(x)
+        self.assertEqual(counter.calls, [1, 2, 3, 2])
+
+    def test_disabled_policy(self):
+        """Test that the 'none' policy and a maxsize of 0 disable caching."""
+        for options in ({"policy": "none"}, {"policy": "lru", "maxsize": 0}):
+            with self.subTest(**options):
+                configure(**options)
+                counter = Counter()
+                counter.square(2)
+                counter.square(2)
+                self.assertEqual(counter.calls, [2, 2])
+
+    def test_byte_budget(self):
+        """Test that partitions stay within their estimated byte budget."""
+        entry_size = estimate_size((2**64,)) + estimate_size(2**128)
+        configure(maxsize=None, max_bytes=2 * entry_size)
+        counter = Counter()
+        for x in (2**64, 2**64 + 1, 2**64 + 2, 2**64):
+            counter.square(x)
+        self.assertEqual(len(counter.calls), 4)
+        partition = cache._partitions[id(counter)]["Counter.square"]
+        self.assertLessEqual(partition.bytes, 2 * entry_size)
+        self.assertEqual(len(partition), 2)
+
+    def test_operation_specific_configuration(self):
+        """Test that an operation can be configured on its own."""
+        configure(policy="none", operations=["Counter.square"])
+        self.assertEqual(cache.get_config("Counter.square").policy, "none")
+        self.assertEqual(cache.get_config().policy, "lru")
+        counter = Counter()
+        counter.square(2)
+        counter.square(2)
+        self.assertEqual(counter.calls, [2, 2])
+
+    def test_invalid_policy(self):
+        """Test that an unknown policy raises a ValueError."""
+        with self.assertRaises(ValueError):
+            configure(policy="fifo")
+
+    def test_instances_without_weak_references_are_rejected(self):
+        """Test that cached methods fail loudly on instances without weak references."""
+
+        class Slotted:
+            __slots__ = ()
+
+            @cached
+            def square(self, x):
+                return x * x
+
+        with self.assertRaises(TypeError):
+            Slotted().square(2)
+
+    def test_instances_are_not_kept_alive(self):
+        """Test that caches hold no strong reference to their instance."""
+        counter = Counter()
+        counter.square(2)
+        key = id(counter)
+        self.assertIn(key, cache._partitions)
+        del counter
+        gc.collect()
+        self.assertNotIn(key, cache._partitions)
+
+
+class TestCacheStats(unittest.TestCase):
+    """Test cases for the cache statistics and their scoping."""
+
+    def setUp(self):
+        reset_config()
+        # Independent of the LRU_CACHE_MAXSIZE default, which may disable caching
+        configure(policy="lru", maxsize=1024)
+        cache.reset_stats()
+
+    def tearDown(self):
+        reset_config()
+
+    def test_stats(self):
+        """Test that hits, misses, evictions and sizes are reported per operation."""
+        configure(maxsize=2)
+        counter = Counter()
+        for x in (1, 1, 2, 3):
+            counter.square(x)
+        report = ecutils.stats()["Counter.square"]
+        self.assertEqual((report.hits, report.misses, report.evictions), (1, 3, 1))
+        self.assertEqual(report.size, 2)
+        self.assertGreater(report.bytes, 0)
+        self.assertEqual(report.hit_rate, 0.25)
+
+    def test_reset_stats(self):
+        """Test that resetting the statistics keeps the cached entries."""
+        counter = Counter()
+        counter.square(1)
+        ecutils.reset_stats()
+        counter.square(1)
+        report = ecutils.stats()["Counter.square"]
+        self.assertEqual((report.hits, report.misses), (1, 0))
+        self.assertEqual(counter.calls, [1])
+
+    def test_measure(self):
+        """Test that the context manager only reports the work done in its block."""
+        counter = Counter()
+        counter.square(1)
+        with ecutils.measure() as scoped:
+            self.assertEqual(scoped, {})
+            counter.square(1)
+            counter.square(2)
+        self.assertEqual(scoped["Counter.square"].hits, 1)
+        self.assertEqual(scoped["Counter.square"].misses, 1)
+        self.assertEqual(scoped["Counter.square"].size, 1)
+        # Bytes are only estimated on request
+        self.assertEqual(scoped["Counter.square"].bytes, 0)
+        with ecutils.measure(with_bytes=True) as scoped:
+            counter.square(3)
+        self.assertGreater(scoped["Counter.square"].bytes, 0)
+        self.assertNotIn("DigitalSignature.verify_signature", scoped)
+
+    def test_lru_cache_functions_are_reported(self):
+        """Test that the functools.lru_cache wrapped functions appear in the report."""
+        # Functions are registered when their module is imported
+        import ecutils.curves  # noqa: F401
+
+        self.assertIn("curves.get", ecutils.stats(with_bytes=False))
+
+    def test_package_exports_are_lazy(self):
+        """Test that importing the package does not import the cache module, and that
+        the statistics functions are still available from it."""
+        code = "import sys, ecutils; print('ecutils.cache' in sys.modules)"
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        ).stdout
+        self.assertEqual(output.split(), ["False"])
+        self.assertIs(ecutils.measure, cache.measure)
+        self.assertIn("reset_stats", dir(ecutils))
@@ -0,0 +1,118 @@
+import io
+import os
+import tempfile
+import unittest
+
+from ecutils.algorithms import Koblitz
+from ecutils.container import HEADER, KoblitzContainer
+from ecutils.core import Point
+
+
+class TestKoblitzContainer(unittest.TestCase):
+    """Test cases for the random-access container of encoded Koblitz chunks."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "message.eckb")
+        self.koblitz = Koblitz(curve_name="secp192k1")
+        self.message = "".join(chr(32 + i % 95) for i in range(23 * 40 + 7))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """Test that a written message is decoded whole and by ranges of chunks."""
+        with KoblitzContainer(self.path, "w", koblitz=self.koblitz) as container:
+            self.assertEqual(container.write(self.message), 41)
+
+        with KoblitzContainer(self.path) as container:
+            self.assertEqual(len(container), 41)
+            self.assertEqual(container.chunk_size, 23)
+            self.assertEqual(container.record_size, 26)
+            self.assertEqual(
+                os.path.getsize(self.path), HEADER.size + 41 * container.record_size
+            )
+            self.assertEqual(container.decode(), self.message)
+            self.assertEqual(container.decode(10, 12), self.message[230:276])
+            self.assertEqual(container.decode(-1), self.message[-7:])
+            expected = self.koblitz.encode(self.message, lengthy=True)
+            self.assertEqual(container[0], expected[0])
+            self.assertEqual(container[-1], expected[-1])
+            self.assertEqual(container[3:5], list(expected[3:5]))
+            with self.assertRaises(IndexError):
+                container[41]
+
+    def test_append(self):
+        """Test that appending keeps the stored chunks and creates missing files."""
+        first, second = self.message[:230], self.message[230:]
+        with KoblitzContainer(self.path, "a", curve_name="secp192k1") as container:
+            container.write(first)
+        with KoblitzContainer(self.path, "a") as container:
+            self.assertEqual(container.write(io.StringIO(second)), 31)
+            self.assertEqual(container.decode(), self.message)
+        with open(self.path, "rb") as file:
+            header = file.read(HEADER.size)
+        with KoblitzContainer(self.path, "a") as container:
+            container.append(self.koblitz.encode("!", lengthy=True))
+            self.assertEqual(container.decode(-2), self.message[-7:] + "!")
+        with open(self.path, "rb") as file:
+            self.assertEqual(file.read(HEADER.size), header)
+
+    def test_torn_record_is_ignored(self):
+        """Test that a partial record left by an interrupted append is ignored and
+        overwritten by the next append."""
+        with KoblitzContainer(self.path, "w", koblitz=self.koblitz) as container:
+            container.write(self.message[:46])
+        with open(self.path, "ab") as file:
+            file.write(b"\x02\x01")
+        with KoblitzContainer(self.path, "a") as container:
+            self.assertEqual(len(container), 2)
+            container.write(self.message[46:69])
+            self.assertEqual(container.decode(), self.message[:69])
+
+    def test_invalid_containers(self):
+        """Test that mismatched, foreign and read-only containers are rejected."""
+        with KoblitzContainer(self.path, "w", koblitz=self.koblitz) as container:
+            container.write(self.message[:23])
+        with self.assertRaises(ValueError):
+            KoblitzContainer(self.path, curve_name="secp256k1")
+        with self.assertRaises(ValueError):
+            KoblitzContainer(self.path, alphabet_size=2**16)
+        with KoblitzContainer(self.path) as container:
+            with self.assertRaises(ValueError):
+                container.append(self.koblitz.encode("read-only", lengthy=True))
+        g = self.koblitz.curve.G
+        with KoblitzContainer(self.path, "a") as container:
+            with self.assertRaises(ValueError):
+                container.append([(Point(g.x, g.y + 1), 1)])
+            with self.assertRaises(ValueError):
+                container.append([(Point(g.x, None), 1)])
+            self.assertEqual(len(container), 1)
+        self.assertEqual(
+            os.path.getsize(self.path), HEADER.size + container.record_size
+        )
+        with KoblitzContainer(self.path) as container:
+            self.assertEqual(container.decode(), self.message[:23])
+
+        foreign = os.path.join(self.directory.name, "foreign.eckb")
+        with open(foreign, "wb") as file:
+            file.write(b"\x00" * HEADER.size)
+        with self.assertRaises(ValueError):
+            KoblitzContainer(foreign)
+        with self.assertRaises(ValueError):
+            KoblitzContainer(self.path, "x")
+
+    def test_mismatched_koblitz_is_rejected(self):
+        """Test that a curve name and a Koblitz instance on another curve are rejected,
+        without creating or replacing the file."""
+        for mode in ("w", "a"):
+            with self.subTest(mode=mode):
+                with self.assertRaises(ValueError):
+                    KoblitzContainer(
+                        self.path, mode, curve_name="secp256k1", koblitz=self.koblitz
+                    )
+                self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 
+from ecutils.core import Point
 from ecutils.protocols import DiffieHellman
 
 
@@ -21,3 +22,9 @@ class TestDiffieHellman(unittest.TestCase):
 
         # The secrets should match
         self.assertEqual(secret_alice, secret_bob, "Shared secrets should be equal.")
+
+    def test_invalid_public_key(self):
+        """Validate that a peer public key that is not on the curve is rejected."""
+        dh_alice = DiffieHellman(12345)
+        with self.assertRaises(ValueError):
+            dh_alice.compute_shared_secret(Point(x=200, y=119))
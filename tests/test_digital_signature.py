@@ -31,3 +31,11 @@ class TestDigitalSignature(unittest.TestCase):
             self.ds.verify_signature(
                 self.ds.public_key, message_hash, invalid_r, invalid_s
             )
+
+    def test_verify_signature_with_wrong_message(self):
+        """Ensure that a signature does not verify against a different message."""
+        r, s = self.ds.generate_signature(hash("Signing this message"))
+        is_valid = self.ds.verify_signature(
+            self.ds.public_key, hash("Another message"), r, s
+        )
+        self.assertFalse(is_valid, "The signature should be invalid.")
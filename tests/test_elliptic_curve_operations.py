@@ -1,7 +1,11 @@
 import unittest
+from dataclasses import replace
 
-from ecutils.core import EllipticCurve, Point
+from ecutils import cache
+from ecutils.core import EllipticCurve, JacobianPoint, Point, wnaf
+from ecutils.curves import get as get_curve
 from ecutils.curves import secp192k1
+from ecutils.instrumentation import count_operations
 
 
 class TestEllipticCurveOperations(unittest.TestCase):
@@ -317,3 +321,403 @@ class TestEllipticCurveOperations(unittest.TestCase):
             expected_result_at_infinity,
             "Multiplying the point at infinity by any scalar should remain the point at infinity.",
         )
+
+    def test_generator_multiplication_matches_generic_multiplication(self):
+        """Test that the precomputed generator table agrees with the generic
+        double-and-add multiplication on every named curve."""
+
+        for name in (
+            "secp192k1",
+            "secp192r1",
+            "secp224k1",
+            "secp224r1",
+            "secp256k1",
+            "secp256r1",
+            "secp384r1",
+            "secp521r1",
+        ):
+            curve = get_curve(name)
+            for k in (1, 2, 0xF0F0F0F0F, curve.n // 3, curve.n - 1):
+                with self.subTest(curve=name, k=k):
+                    self.assertEqual(
+                        curve.to_affine(curve.jacobian_multiply_generator(k)),
+                        curve.to_affine(
+                            curve.jacobian_multiply_point(k, curve.to_jacobian(curve.G))
+                        ),
+                        "Generator multiplication result is incorrect.",
+                    )
+
+    def test_wnaf_recoding(self):
+        """Test that the width-w NAF digits reconstruct the scalar and respect the
+        digit bounds and sparsity of the representation."""
+
+        for width in (2, 4, 6):
+            for k in (1, 7, 0xEA525DD5A1353762A14E9E78B9063316D1F2D5E792F87862):
+                with self.subTest(width=width, k=k):
+                    digits = wnaf(k, width)
+                    self.assertEqual(sum(d << i for i, d in enumerate(digits)), k)
+                    for i, digit in enumerate(digits):
+                        if digit:
+                            self.assertEqual(digit % 2, 1)
+                            self.assertLess(abs(digit), 2 ** (width - 1))
+                            self.assertFalse(any(digits[i + 1 : i + width]))
+
+    def test_wnaf_multiplication_matches_affine_multiplication(self):
+        """Test that the Jacobian wNAF multiplication agrees with the affine
+        double-and-add multiplication."""
+
+        self.curve.__class__.use_projective_coordinates = False
+        expected = [
+            self.curve.multiply_point(k, self.point2)
+            for k in (3, 0xEA525DD5A1353762A14E9E78B9063316D1F2D5E792F87862)
+        ]
+        self.curve.__class__.use_projective_coordinates = True
+        calculated = [
+            self.curve.multiply_point(k, self.point2)
+            for k in (3, 0xEA525DD5A1353762A14E9E78B9063316D1F2D5E792F87862)
+        ]
+        self.assertEqual(
+            calculated, expected, "Scalar multiplication result is incorrect."
+        )
+
+    def test_multiply_add(self):
+        """Test that the simultaneous multiplication agrees with two separate
+        multiplications followed by an addition, in both coordinate systems."""
+
+        k1, k2 = 0xEA525DD5A1353762A14E9E78B9063316D1F2D5E792F87862, 12345
+        for use_projective_coordinates in (True, False):
+            self.curve.__class__.use_projective_coordinates = use_projective_coordinates
+            with self.subTest(use_projective_coordinates=use_projective_coordinates):
+                expected = self.curve.add_points(
+                    self.curve.multiply_point(k1, self.curve.G),
+                    self.curve.multiply_point(k2, self.point1),
+                )
+                self.assertEqual(
+                    self.curve.multiply_add(k1, self.curve.G, k2, self.point1),
+                    expected,
+                    "Simultaneous multiplication result is incorrect.",
+                )
+                self.assertEqual(
+                    self.curve.multiply_add(0, self.point2, k2, self.point1),
+                    self.curve.multiply_point(k2, self.point1),
+                    "Simultaneous multiplication result is incorrect.",
+                )
+        self.curve.__class__.use_projective_coordinates = True
+
+    def test_invalid_multiply_add(self):
+        """Test simultaneous multiplication with invalid scalars or points."""
+        with self.assertRaises(ValueError):
+            self.curve.multiply_add(self.curve.n, self.point1, 1, self.point2)
+        with self.assertRaises(ValueError):
+            self.curve.multiply_add(1, self.point1, 1, Point(x=200, y=119))
+
+    def test_multi_scalar_multiply(self):
+        """Test that the Straus and Pippenger multi-scalar multiplications agree with
+        summing the individual products."""
+
+        scalars = [3, 0, 0xEA525DD5A1353762A14E9E78B9063316D1F2D5E792F87862, 12345]
+        points = [self.point1, self.point2, self.curve.G, self.point2]
+        expected = Point()
+        for k, p in zip(scalars, points):
+            if k:
+                expected = self.curve.add_points(
+                    expected, self.curve.multiply_point(k, p)
+                )
+
+        self.assertEqual(
+            self.curve.multi_scalar_multiply(scalars, points),
+            expected,
+            "Multi-scalar multiplication result is incorrect.",
+        )
+        jacobian_points = [self.curve.to_jacobian(p) for p in points]
+        for method in (
+            self.curve.jacobian_straus_multiply,
+            self.curve.jacobian_pippenger_multiply,
+        ):
+            with self.subTest(method=method.__name__):
+                self.assertEqual(
+                    self.curve.to_affine(method(scalars, jacobian_points)),
+                    expected,
+                    "Multi-scalar multiplication result is incorrect.",
+                )
+        self.assertEqual(self.curve.multi_scalar_multiply([], []), Point())
+
+    def test_pippenger_multiplication(self):
+        """Test Pippenger's method with buckets that double and cancel, and that it
+        makes no cached additions."""
+        curve = replace(secp192k1)
+        g = curve.to_jacobian(curve.G)
+        negated_g = curve.jacobian_negate_point(g)
+        p2 = curve.to_jacobian(self.point2)
+        scalars = [5, 5, 7, 7, 2**150 + 3, 1]
+        points = [g, g, g, negated_g, p2, p2]
+        expected = curve.multiply_point(10, curve.G)
+        expected = curve.add_points(
+            expected, curve.multiply_point(2**150 + 4, self.point2)
+        )
+        cache.configure(policy="lru", maxsize=1024)
+        self.addCleanup(cache.reset_config)
+        with cache.measure() as spent:
+            result = curve.jacobian_pippenger_multiply(scalars, points)
+        self.assertEqual(curve.to_affine(result), expected)
+        self.assertNotIn("EllipticCurveOperations.jacobian_add_points", spent)
+        self.assertEqual(
+            curve.jacobian_pippenger_multiply([3, 3], [g, negated_g]), JacobianPoint()
+        )
+
+    def test_invalid_multi_scalar_multiply(self):
+        """Test multi-scalar multiplication with mismatched or invalid inputs."""
+        with self.assertRaises(ValueError):
+            self.curve.multi_scalar_multiply([1, 2], [self.point1])
+        with self.assertRaises(ValueError):
+            self.curve.multi_scalar_multiply([self.curve.n], [self.point1])
+        with self.assertRaises(ValueError):
+            self.curve.multi_scalar_multiply([1], [Point(x=200, y=119)])
+
+    def test_montgomery_ladder_multiplication(self):
+        """Test that the co-Z Montgomery ladder agrees with the wNAF multiplication,
+        including scalars close to the order of the curve."""
+
+        scalars = (1, 2, 3, 0xEA525DD5A1353762A14E9E78B9063316D1F2D5E792F87862)
+        scalars += (self.curve.n - 2, self.curve.n - 1)
+        for k in scalars:
+            with self.subTest(k=k):
+                self.curve.__class__.use_montgomery_ladder = True
+                try:
+                    calculated = self.curve.multiply_point(k, self.point1)
+                finally:
+                    self.curve.__class__.use_montgomery_ladder = False
+                self.assertEqual(
+                    calculated,
+                    self.curve.multiply_point(k, self.point1),
+                    "Montgomery ladder multiplication result is incorrect.",
+                )
+
+    def test_montgomery_ladder_degenerate_point(self):
+        """Test that the ladder falls back to the generic formulas when the co-Z
+        formulas degenerate on a point of small order."""
+
+        curve = EllipticCurve(p=13, a=1, b=0, G=Point(x=2, y=1), n=4, h=0)
+        point_with_y_zero = curve.to_jacobian(Point(x=0, y=0))
+        self.assertEqual(
+            curve.to_affine(curve.jacobian_montgomery_ladder(3, point_with_y_zero)),
+            curve.to_affine(curve.jacobian_multiply_point(3, point_with_y_zero)),
+            "Montgomery ladder multiplication result is incorrect.",
+        )
+
+    def test_glv_multiplication(self):
+        """Test that the GLV endomorphism is detected on the a = 0 curves and that
+        GLV multiplication agrees with the plain wNAF multiplication."""
+
+        self.assertIsNone(get_curve("secp256r1").glv_parameters)
+        for name in ("secp192k1", "secp224k1", "secp256k1"):
+            curve = get_curve(name)
+            beta, lam, _, _ = curve.glv_parameters
+            self.assertEqual(
+                curve.multiply_point(lam, curve.G),
+                Point(beta * curve.G.x % curve.p, curve.G.y),
+                "The endomorphism should act as multiplication by lambda.",
+            )
+            point = curve.to_jacobian(curve.multiply_point(0xF0F0F0F0F, curve.G))
+            for k in (1, 0xEA525DD5A1353762A14E9E78B9063316D1F2D5E7, curve.n - 1):
+                with self.subTest(curve=name, k=k):
+                    k1, k2 = curve.glv_decompose(k)
+                    self.assertEqual((k1 + k2 * lam - k) % curve.n, 0)
+                    self.assertLessEqual(
+                        max(abs(k1), abs(k2)).bit_length(),
+                        curve.n.bit_length() // 2 + 1,
+                    )
+                    # Scalars of n or more bypass the endomorphism
+                    self.assertEqual(
+                        curve.to_affine(curve.jacobian_multiply_point(k, point)),
+                        curve.to_affine(curve.jacobian_multiply_point(k + curve.n, point)),
+                        "GLV multiplication result is incorrect.",
+                    )
+
+    def test_mixed_point_addition(self):
+        """Test that the mixed addition agrees with the general Jacobian addition,
+        including the doubling and inverse special cases."""
+
+        z = 0x123456789ABCDEF
+        p1 = self.curve.to_jacobian(self.point1)
+        p2 = self.curve.to_jacobian(self.point2)
+        # The same point as p1, represented with z != 1
+        p1_scaled = JacobianPoint(
+            p1.x * z * z % self.curve.p, p1.y * z * z * z % self.curve.p, z
+        )
+        for other, expected in (
+            (p2, self.curve.add_points(self.point1, self.point2)),
+            (p1, self.curve.add_points(self.point1, self.point1)),
+            (self.curve.jacobian_negate_point(p1), Point()),
+        ):
+            with self.subTest(other=other):
+                self.assertEqual(
+                    self.curve.to_affine(
+                        self.curve.jacobian_add_mixed_points(p1_scaled, other)
+                    ),
+                    expected,
+                    "Mixed point addition result is incorrect.",
+                )
+                self.assertEqual(
+                    self.curve.to_affine(
+                        self.curve.jacobian_add_points(other, p1_scaled)
+                    ),
+                    expected,
+                    "Point addition result is incorrect.",
+                )
+
+    def test_specialized_doubling_formulas(self):
+        """Test that the a = 0 and a = -3 doubling formulas are selected on the
+        matching curves and agree with the affine doubling."""
+
+        shapes = {
+            "secp192k1": (True, False),
+            "secp192r1": (False, True),
+            "secp224k1": (True, False),
+            "secp224r1": (False, True),
+            "secp256k1": (True, False),
+            "secp256r1": (False, True),
+            "secp384r1": (False, True),
+            "secp521r1": (False, True),
+        }
+        z = 0x123456789ABCDEF
+        for name, shape in shapes.items():
+            with self.subTest(curve=name):
+                curve = get_curve(name)
+                self.assertEqual((curve.a_is_zero, curve.a_is_minus_three), shape)
+                g = JacobianPoint(
+                    curve.G.x * z * z % curve.p, curve.G.y * z * z * z % curve.p, z
+                )
+                self.assertEqual(
+                    curve.to_affine(curve.jacobian_double_point(g)),
+                    curve.double_point(curve.G),
+                    "Point doubling result is incorrect.",
+                )
+
+    def test_to_affine_batch(self):
+        """Test that the batched conversion agrees with converting each point on its
+        own, including points at infinity."""
+
+        points = [
+            self.curve.jacobian_double_point(self.curve.to_jacobian(self.point1)),
+            JacobianPoint(),
+            self.curve.jacobian_add_points(
+                self.curve.to_jacobian(self.point1),
+                self.curve.jacobian_double_point(self.curve.to_jacobian(self.point2)),
+            ),
+            self.curve.to_jacobian(self.point2),
+        ]
+        self.assertEqual(
+            self.curve.to_affine_batch(points),
+            [self.curve.to_affine(point) for point in points],
+            "Batched conversion to affine coordinates is incorrect.",
+        )
+        self.assertEqual(self.curve.to_affine_batch([]), [])
+
+    def test_multiply_point_batch(self):
+        """Test that the batched multiplication agrees with multiply_point."""
+        scalars = [1, 2, 0xEA525DD5A1353762A14E9E78B9063316D1F2D5E792F87862]
+        for point in (self.curve.G, self.point1):
+            with self.subTest(point=point):
+                self.assertEqual(
+                    self.curve.multiply_point_batch(scalars, point),
+                    [self.curve.multiply_point(k, point) for k in scalars],
+                    "Batched scalar multiplication result is incorrect.",
+                )
+        with self.assertRaises(ValueError):
+            self.curve.multiply_point_batch([1, 0], self.point1)
+        with self.assertRaises(ValueError):
+            self.curve.multiply_point_batch([1], Point(x=200, y=119))
+
+    def test_points_are_validated_once(self):
+        """Test that multiply_point checks its input once and trusts its own
+        intermediate points, in both coordinate systems."""
+
+        for projective in (False, True):
+            with self.subTest(projective=projective):
+                curve = replace(self.curve)
+                curve.glv_parameters  # One-off setup, which checks G
+                curve.__class__.use_projective_coordinates = projective
+                try:
+                    with count_operations() as spent:
+                        curve.multiply_point(0xEA525DD5A1353762A14E9E78B, self.point1)
+                finally:
+                    curve.__class__.use_projective_coordinates = True
+                counts = spent["secp192k1", "EllipticCurveOperations.multiply_point"]
+                self.assertEqual(counts.on_curve_checks, 1)
+                self.assertGreater(counts.doublings, 90)
+
+    def test_sqrt_mod_p(self):
+        """Test square roots on curves with p = 3 (mod 4) and p = 1 (mod 4)."""
+        for name in ("secp192k1", "secp224k1", "secp224r1", "secp521r1"):
+            with self.subTest(curve=name):
+                curve = get_curve(name)
+                g = curve.G
+                rhs = (g.x**3 + curve.a * g.x + curve.b) % curve.p
+                y = curve.sqrt_mod_p(rhs)
+                self.assertIn(y, (g.y, curve.p - g.y))
+                self.assertEqual(curve.sqrt_mod_p(0), 0)
+                self.assertIsNone(curve.sqrt_mod_p(curve.square_root.non_residue))
+                self.assertEqual(
+                    curve.sqrt_mod_p_batch([rhs, curve.square_root.non_residue, 4]),
+                    [y, None, curve.sqrt_mod_p(4)],
+                )
+        self.assertEqual(get_curve("secp224r1").square_root.s, 96)
+
+    def test_sec1_encoding(self):
+        """Test compressed and uncompressed SEC1 encodings against a known vector and
+        round trips on curves with p = 3 (mod 4) and p = 1 (mod 4)."""
+        secp256k1 = get_curve("secp256k1")
+        encoded = secp256k1.encode_point(secp256k1.G)
+        self.assertEqual(
+            encoded.hex(),
+            "0279be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798",
+        )
+        self.assertEqual(secp256k1.decode_point(encoded), secp256k1.G)
+        self.assertEqual(secp256k1.encode_point(Point()), b"\x00")
+        self.assertEqual(secp256k1.decode_point(b"\x00"), Point())
+
+        for name in ("secp192k1", "secp224r1", "secp521r1"):
+            with self.subTest(curve=name):
+                curve = get_curve(name)
+                points = curve.multiply_point_batch([1, 2, 3, curve.n - 1], curve.G)
+                points.append(Point())
+                for compressed in (True, False):
+                    encodings = curve.encode_points(points, compressed)
+                    size = 1 + curve.coordinate_size * (1 if compressed else 2)
+                    self.assertEqual(len(encodings[0]), size)
+                    self.assertEqual(curve.decode_points(encodings), points)
+
+    def test_invalid_sec1_encoding(self):
+        """Test that malformed encodings and points off the curve are rejected."""
+        curve = get_curve("secp256k1")
+        compressed = curve.encode_point(curve.G)
+        uncompressed = curve.encode_point(curve.G, compressed=False)
+        x = curve.G.x
+        while curve.sqrt_mod_p((x**3 + curve.b) % curve.p) is not None:
+            x += 1
+        invalid = [
+            b"",
+            b"\x05" + compressed[1:],
+            compressed[:-1],
+            uncompressed[:-1] + bytes([uncompressed[-1] ^ 1]),
+            b"\x02" + x.to_bytes(32, "big"),
+            b"\x02" + curve.p.to_bytes(32, "big"),
+        ]
+        for data in invalid:
+            with self.subTest(data=data.hex()):
+                with self.assertRaises(ValueError):
+                    curve.decode_point(data)
+        with self.assertRaises(ValueError):
+            curve.decode_points([compressed, invalid[-1]])
+
+    def test_schedule_doubling_with_zero_x(self):
+        """Test that a doubling in the schedule yielding x = 0 is not taken for the
+        point at infinity."""
+        for name in ("secp192r1", "secp256r1", "secp384r1", "secp521r1"):
+            with self.subTest(curve=name):
+                curve = get_curve(name)
+                q = Point(0, curve.sqrt_mod_p(curve.b))
+                r = curve.multiply_point((curve.n + 1) // 2, q)
+                self.assertEqual(curve.multiply_add(1, r, 1, r), q)
+                self.assertEqual(curve.multi_scalar_multiply([1, 1], [r, r]), q)
@@ -0,0 +1,98 @@
+import random
+import unittest
+
+from ecutils.curves import secp256r1, secp521r1
+from ecutils.field import (
+    MersennePrime,
+    ModularSquareRoot,
+    fast_modulus,
+    jacobi_symbol,
+)
+
+
+class TestFastModulus(unittest.TestCase):
+    """Test cases for the curve-specific modular reduction strategies."""
+
+    def test_strategy_selection(self):
+        """Test that only primes of the form 2**k - 1 get the folding reduction."""
+        self.assertIsInstance(fast_modulus(2**521 - 1), MersennePrime)
+        self.assertIs(type(fast_modulus(int(secp256r1.p))), int)
+        self.assertIsInstance(secp521r1.p, MersennePrime)
+        self.assertEqual(secp521r1.p, 2**521 - 1)
+        self.assertEqual(repr(secp521r1.p), repr(2**521 - 1))
+
+    def test_mersenne_reduction(self):
+        """Test that the folding reduction matches the built-in reduction, including
+        for negative and already reduced numbers."""
+        p = 2**521 - 1
+        modulus = MersennePrime(p)
+        rng = random.Random(521)
+        values = [0, 1, p - 1, p, p + 1, -1, -p, p * p]
+        values += [rng.randrange(p) * rng.randrange(p) for _ in range(100)]
+        values += [-rng.randrange(p) * rng.randrange(p) for _ in range(100)]
+        for x in values:
+            self.assertEqual(x % modulus, x % p)
+            self.assertIs(type(x % modulus), int)
+
+
+class TestJacobiSymbol(unittest.TestCase):
+    """Test cases for the binary Jacobi symbol."""
+
+    def test_matches_euler_criterion(self):
+        """Test that the symbol agrees with Euler's criterion modulo the curve primes."""
+        rng = random.Random(22)
+        for p in (int(secp256r1.p), secp521r1.p, 23):
+            for a in [0, 1, 2, p - 1, p, -1] + [rng.randrange(p) for _ in range(50)]:
+                euler = pow(a, (p - 1) // 2, p)
+                self.assertEqual(jacobi_symbol(a, p), -1 if euler == p - 1 else euler)
+
+    def test_composite_modulus(self):
+        """Test the symbol modulo odd composites, and that even moduli are rejected."""
+        self.assertEqual(jacobi_symbol(2, 15), 1)
+        self.assertEqual(jacobi_symbol(7, 15), -1)
+        self.assertEqual(jacobi_symbol(5, 15), 0)
+        self.assertEqual(jacobi_symbol(1001, 9907), -1)
+        for n in (0, -3, 16):
+            with self.assertRaises(ValueError):
+                jacobi_symbol(3, n)
+
+
+class TestModularSquareRoot(unittest.TestCase):
+    """Test cases for the square roots modulo a prime."""
+
+    def test_small_primes(self):
+        """Test every residue modulo primes with 2-adic valuations from 1 to 8, with
+        windows that do and do not divide the valuation."""
+        for p in (3, 7, 13, 17, 41, 97, 193, 257, 7681):
+            squares = {x * x % p for x in range(p)}
+            for window in (1, 2, 3, 6):
+                root = ModularSquareRoot(p, window)
+                with self.subTest(p=p, window=window):
+                    for a in range(p):
+                        y = root.sqrt(a)
+                        if a in squares:
+                            self.assertEqual(y * y % p, a)
+                        else:
+                            self.assertIsNone(y)
+                    self.assertEqual(
+                        root.sqrt_batch(range(p)), [root.sqrt(a) for a in range(p)]
+                    )
+
+    def test_secp224r1_prime(self):
+        """Test the prime with p = 1 (mod 2**96), where the window tables matter most."""
+        p = 2**224 - 2**96 + 1
+        root = ModularSquareRoot(p)
+        self.assertEqual((root.s, root.non_residue), (96, 11))
+        self.assertEqual(root.q << root.s, p - 1)
+        rng = random.Random(224)
+        for _ in range(100):
+            x = rng.randrange(1, p)
+            y = root.sqrt(x * x)
+            self.assertIn(y, (x, p - x))
+            self.assertIsNone(root.sqrt(x * x * root.non_residue))
+
+    def test_invalid_modulus(self):
+        """Test that even moduli are rejected."""
+        for p in (2, 16):
+            with self.assertRaises(ValueError):
+                ModularSquareRoot(p)
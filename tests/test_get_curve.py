@@ -1,6 +1,11 @@
+import os
+import subprocess
+import sys
 import unittest
+from dataclasses import replace
 
-from ecutils.curves import get, secp256k1
+from ecutils.algorithms import DigitalSignature
+from ecutils.curves import get, names, register, secp256k1
 
 
 class TestGetCurve(unittest.TestCase):
@@ -23,3 +28,40 @@ class TestGetCurve(unittest.TestCase):
             msg="Should raise KeyError with appropriate message for invalid curve name.",
         ):
             get(curve_name)
+
+    def test_same_instance(self):
+        """Test that a curve is built once and then shared."""
+        self.assertIs(get("secp256k1"), secp256k1)
+        self.assertIs(get("secp384r1"), get("secp384r1"))
+
+    def test_curves_are_built_lazily(self):
+        """Test that importing the package builds no curve and skips multiprocessing."""
+        code = (
+            "import sys, ecutils.algorithms, ecutils.protocols; "
+            "from ecutils import curves; "
+            "print(len(curves._registry), 'multiprocessing' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        ).stdout
+        self.assertEqual(output.split(), ["0", "False"])
+
+    def test_register_custom_curve(self):
+        """Test that a registered curve is available by name, also to the algorithms."""
+        curve = replace(secp256k1)
+        register("test-custom-curve", curve)
+        self.assertIs(get("test-custom-curve"), curve)
+        self.assertIn("test-custom-curve", names())
+
+        signer = DigitalSignature(123456789, curve_name="test-custom-curve")
+        r, s = signer.generate_signature(42)
+        self.assertTrue(signer.verify_signature(signer.public_key, 42, r, s))
+
+        with self.assertRaises(ValueError):
+            register("test-custom-curve", curve)
+        with self.assertRaises(ValueError):
+            register("secp256k1", curve)
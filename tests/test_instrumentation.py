@@ -0,0 +1,172 @@
+import unittest
+from dataclasses import replace
+
+from ecutils import cache, instrumentation
+from ecutils.algorithms import DigitalSignature, Koblitz
+from ecutils.core import EllipticCurveOperations
+from ecutils.curves import get as get_curve
+from ecutils.instrumentation import OperationCounts, count_operations
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for the opt-in field-operation counters."""
+
+    def setUp(self):
+        # A fresh copy of the curve, so that its method caches are empty
+        self.curve = replace(get_curve("secp192k1"))
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+        cache.reset_config()
+
+    def test_disabled_by_default(self):
+        """Test that the original methods are in place while counting is disabled."""
+        self.assertFalse(instrumentation.is_enabled())
+        double = EllipticCurveOperations.__dict__["jacobian_double_point"]
+        self.assertEqual(double.func.__module__, "ecutils.core")
+        self.curve.multiply_point(5, self.curve.G)
+        self.assertEqual(instrumentation.counts(), {})
+
+    def test_disable_restores_methods(self):
+        """Test that disabling restores every patched method."""
+        before = dict(EllipticCurveOperations.__dict__)
+        instrumentation.enable()
+        self.assertTrue(instrumentation.is_enabled())
+        instrumentation.disable()
+        self.assertEqual(dict(EllipticCurveOperations.__dict__), before)
+        self.assertEqual(
+            EllipticCurveOperations.__dict__["add_points"].func.__module__,
+            "ecutils.core",
+        )
+
+    def test_counts_doubling(self):
+        """Test that a doubling is counted with the cost of the selected formula."""
+        with count_operations() as spent:
+            self.curve.multiply_point(2, self.curve.G)
+
+        counts = spent["secp192k1", "EllipticCurveOperations.multiply_point"]
+        self.assertGreaterEqual(counts.doublings, 1)
+        self.assertGreaterEqual(counts.inversions, 1)
+        self.assertEqual(counts.on_curve_checks, 1)
+
+    def test_cache_hits_cost_nothing(self):
+        """Test that a repeated call served from the cache records no operations."""
+        # Independent of the LRU_CACHE_MAXSIZE default, which may disable caching
+        cache.configure(policy="lru", maxsize=16)
+        point = self.curve.multiply_point(7, self.curve.G)
+        with count_operations() as spent:
+            self.assertEqual(self.curve.multiply_point(7, self.curve.G), point)
+        self.assertEqual(spent, {})
+
+    def test_outermost_call_is_the_scope(self):
+        """Test that nested calls are attributed to the outermost high-level call."""
+        signer = DigitalSignature(987654321, "secp192k1")
+        public_key = signer.public_key
+        with count_operations() as spent:
+            r, s = signer.generate_signature(42)
+            self.assertTrue(signer.verify_signature(public_key, 42, r, s))
+
+        self.assertEqual(
+            set(spent),
+            {
+                ("secp192k1", "DigitalSignature.generate_signature"),
+                ("secp192k1", "DigitalSignature.verify_signature"),
+            },
+        )
+        verify = spent["secp192k1", "DigitalSignature.verify_signature"]
+        self.assertGreater(verify.doublings, 0)
+        self.assertGreater(verify.multiplications, verify.doublings)
+
+    def test_koblitz_encode(self):
+        """Test that the square root exponentiation of Koblitz encoding is counted."""
+        koblitz = Koblitz("secp192k1")
+        with count_operations() as spent:
+            koblitz.encode("Counting operations")
+
+        counts = spent["secp192k1", "Koblitz.encode"]
+        # One square root by square-and-multiply and the squaring that checks it. The
+        # root is not checked against the curve equation again.
+        exponent = (self.curve.p + 1) // 4
+        self.assertEqual(counts.square_roots, 1)
+        self.assertGreaterEqual(counts.jacobi_symbols, 1)
+        self.assertEqual(counts.multiplications, bin(exponent).count("1") - 1)
+        self.assertEqual(counts.squarings, exponent.bit_length())
+        self.assertEqual(counts.on_curve_checks, 0)
+
+    def test_square_roots(self):
+        """Test that square roots count their exponentiations, including the
+        Tonelli-Shanks correction on primes with p = 1 (mod 4)."""
+        with count_operations() as spent:
+            self.assertIsNotNone(self.curve.sqrt_mod_p(4))
+            self.assertEqual(self.curve.sqrt_mod_p_batch([4, 0]), [2, 0])
+        counts = spent["secp192k1", instrumentation.UNSCOPED]
+        self.assertEqual((counts.square_roots, counts.jacobi_symbols), (3, 2))
+        # Two exponentiations, each with the squaring that checks the root
+        exponent = (self.curve.p + 1) // 4
+        self.assertEqual(counts.squarings, 2 * exponent.bit_length())
+
+        other = replace(get_curve("secp224r1"))
+        root = other.square_root
+        with count_operations() as spent:
+            other.sqrt_mod_p(4)
+        counts = spent["secp224r1", instrumentation.UNSCOPED]
+        self.assertGreater(counts.squarings, ((root.q - 1) // 2).bit_length() + root.s)
+
+    def test_early_exits_are_not_charged(self):
+        """Test that additions stopped by equal x coordinates only count the work done
+        before the stop, and the doubling they fall back to."""
+        g = self.curve.to_jacobian(self.curve.G)
+        with count_operations() as spent:
+            self.curve.jacobian_add_mixed_points(g, g)
+            self.curve.jacobian_add_mixed_points(g, self.curve.jacobian_negate_point(g))
+        self.assertEqual(
+            spent["secp192k1", instrumentation.UNSCOPED],
+            # Two stopped mixed additions around one a = 0 doubling
+            OperationCounts(multiplications=8, squarings=7, doublings=1),
+        )
+
+    def test_aggregates_per_curve(self):
+        """Test that counts of different curves are kept apart."""
+        other = replace(get_curve("secp256r1"))
+        with count_operations() as spent:
+            self.curve.multiply_point(3, self.curve.G)
+            other.multiply_point(3, other.G)
+
+        self.assertIn(("secp192k1", "EllipticCurveOperations.multiply_point"), spent)
+        self.assertIn(("secp256r1", "EllipticCurveOperations.multiply_point"), spent)
+
+    def test_custom_curve_label(self):
+        """Test that an unnamed curve is labelled by its prime."""
+        self.assertEqual(instrumentation.curve_label(self.curve), "secp192k1")
+        custom = replace(self.curve, b=5)
+        self.assertEqual(
+            instrumentation.curve_label(custom), f"custom(p={hex(custom.p)})"
+        )
+
+    def test_unscoped_operations(self):
+        """Test that formulas called directly are recorded as unscoped."""
+        with count_operations() as spent:
+            self.curve.jacobian_double_point(self.curve.to_jacobian(self.curve.G))
+        self.assertEqual(
+            spent["secp192k1", instrumentation.UNSCOPED],
+            OperationCounts(multiplications=2, squarings=5, doublings=1),
+        )
+
+    def test_counts_are_kept_after_disable(self):
+        """Test that counts accumulate while enabled and survive disabling."""
+        instrumentation.enable()
+        self.curve.multiply_point(11, self.curve.G)
+        instrumentation.disable()
+        self.curve.multiply_point(13, self.curve.G)
+        counts = instrumentation.counts()
+        self.assertEqual(
+            counts["secp192k1", "EllipticCurveOperations.multiply_point"].on_curve_checks,
+            1,
+        )
+        instrumentation.reset()
+        self.assertEqual(instrumentation.counts(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
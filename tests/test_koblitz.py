@@ -1,6 +1,8 @@
+import io
 import unittest
 
-from ecutils.algorithms import Koblitz
+from ecutils import cache
+from ecutils.algorithms import Koblitz, create_executor
 
 
 class TestKoblitz(unittest.TestCase):
@@ -45,3 +47,129 @@ class TestKoblitz(unittest.TestCase):
             decoded_message,
             "Decoded message should match the original lengthy message.",
         )
+
+    def test_lengthy_message_with_executors(self):
+        """Test that injected thread and process executors give the same results as
+        the in-process path."""
+        lengthy_message = "Hello, Elliptic Curve Cryptography! " * 10
+        expected = Koblitz(curve_name="secp521r1").encode(lengthy_message, lengthy=True)
+
+        for threads in (True, False):
+            with self.subTest(threads=threads):
+                executor = create_executor("secp521r1", max_workers=2, threads=threads)
+                with executor:
+                    koblitz = Koblitz(
+                        curve_name="secp521r1",
+                        executor=executor,
+                        chunksize=2,
+                        parallel_threshold=0,
+                    )
+                    self.assertTrue(koblitz.use_executor(1))
+                    encoded = koblitz.encode(lengthy_message, lengthy=True)
+                    self.assertEqual(encoded, expected)
+                    self.assertEqual(
+                        koblitz.decode(encoded, lengthy=True), lengthy_message
+                    )
+
+    def test_short_lengthy_message_stays_in_process(self):
+        """Test that lengthy messages below the threshold do not use the executor."""
+
+        class FailingExecutor:
+            def map(self, *args, **kwargs):
+                raise AssertionError("The executor should not be used.")
+
+        koblitz = Koblitz(
+            curve_name="secp521r1", executor=FailingExecutor(), parallel_threshold=8
+        )
+        self.assertFalse(koblitz.use_executor(7))
+        message = "Hello, EC! " * 20
+        encoded = koblitz.encode(message, lengthy=True)
+        self.assertEqual(koblitz.decode(encoded, lengthy=True), message)
+
+    def test_encode_decode_stream(self):
+        """Test that streaming gives the chunks of a lengthy encoding, lazily."""
+        message = "Streaming Koblitz over file-like objects. " * 8
+        koblitz = Koblitz(curve_name="secp521r1")
+        expected = koblitz.encode(message, lengthy=True)
+
+        reader = io.StringIO(message)
+        stream = koblitz.encode_stream(reader)
+        self.assertEqual(reader.tell(), 0)
+        encoded = list(stream)
+        self.assertEqual(tuple(encoded), expected)
+        self.assertEqual("".join(koblitz.decode_stream(iter(encoded))), message)
+        self.assertEqual(list(koblitz.encode_stream(io.StringIO(""))), [])
+
+    def test_stream_with_executor_backpressure(self):
+        """Test that streams use the executor with a bounded number of pending batches."""
+        message = "Backpressure keeps memory bounded. " * 12
+        expected = Koblitz(curve_name="secp521r1").encode(message, lengthy=True)
+
+        with create_executor("secp521r1", max_workers=2, threads=True) as executor:
+            submitted = []
+            submit = executor.submit
+
+            def counting_submit(function, batch):
+                submitted.append(len(batch))
+                return submit(function, batch)
+
+            executor.submit = counting_submit
+            koblitz = Koblitz(
+                curve_name="secp521r1",
+                executor=executor,
+                chunksize=1,
+                parallel_threshold=0,
+            )
+            stream = koblitz.encode_stream(io.StringIO(message), max_pending=2)
+            first = next(stream)
+            self.assertEqual(first, expected[0])
+            self.assertEqual(len(submitted), 2)
+
+            encoded = [first, *stream]
+            self.assertEqual(tuple(encoded), expected)
+            self.assertEqual(submitted, [1] * len(expected))
+            decoded = koblitz.decode_stream(encoded, max_pending=3)
+            self.assertEqual("".join(decoded), message)
+
+    def test_lengthy_message_on_small_curve(self):
+        """Test that lengthy messages are split to fit below the prime of the curve."""
+        self.assertEqual(self.encoder.chunk_size(2**8), 23)
+        self.assertEqual(Koblitz(curve_name="secp521r1").chunk_size(2**8), 64)
+        self.assertEqual(Koblitz(curve_name="secp521r1").chunk_size(2**16), 32)
+        message = "Hello, Elliptic Curve Cryptography! " * 3
+        encoded = self.encoder.encode(message, lengthy=True)
+        self.assertEqual(len(encoded), 5)
+        self.assertEqual(self.decoder.decode(encoded, lengthy=True), message)
+
+    def test_encoded_chunks_fill_no_cache(self):
+        """Test that encoded chunks are on the curve without an on-curve check, so
+        that encoding adds no entries to the method caches."""
+        cache.configure(policy="lru", maxsize=1024)
+        self.addCleanup(cache.reset_config)
+        for curve_name in ("secp192k1", "secp224r1"):
+            with self.subTest(curve_name=curve_name):
+                koblitz = Koblitz(curve_name=curve_name)
+                with cache.measure(with_bytes=False) as spent:
+                    chunks = [koblitz.encode_chunk(f"chunk {i}") for i in range(20)]
+                self.assertNotIn("EllipticCurveOperations.is_point_on_curve", spent)
+                for point, _ in chunks:
+                    self.assertTrue(koblitz.curve.is_point_on_curve(point))
+
+    def test_encode_decode_bytes(self):
+        """Test that binary data, including zero bytes, survives a round trip."""
+        size, shift = self.encoder.byte_packing
+        self.assertEqual((size, shift), (23, 6))
+        for data in (b"", b"\x00", b"\x00\x01\x00", bytes(range(256)) * 2):
+            with self.subTest(length=len(data)):
+                points = self.encoder.encode_bytes(data)
+                self.assertEqual(len(points), -(-len(data) // size))
+                for point in points:
+                    self.assertTrue(self.encoder.curve.is_point_on_curve(point))
+                self.assertEqual(self.decoder.decode_bytes(points), data)
+
+    def test_decode_bytes_rejects_foreign_points(self):
+        """Test that points without the sentinel byte are rejected."""
+        with self.assertRaises(ValueError):
+            self.decoder.decode_bytes([self.decoder.curve.G])
+        with self.assertRaises(ValueError):
+            self.encoder.encode_bytes_chunk(bytes(24))
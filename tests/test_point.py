@@ -0,0 +1,69 @@
+import copy
+import pickle
+import unittest
+import dataclasses
+from dataclasses import FrozenInstanceError
+
+from ecutils.core import JacobianPoint, Point
+
+
+class TestPoint(unittest.TestCase):
+    """Test cases for the slot-based Point and JacobianPoint types."""
+
+    def test_construction(self):
+        """Test positional, keyword and default arguments."""
+        self.assertEqual(Point(1, 2), Point(x=1, y=2))
+        self.assertIsNone(Point().x)
+        self.assertIsNone(Point().y)
+        self.assertEqual(JacobianPoint(1, 2).z, 1)
+        self.assertEqual(JacobianPoint(x=1, y=2, z=3).z, 3)
+
+    def test_repr(self):
+        """Test that the representation is the one of the former dataclasses."""
+        self.assertEqual(repr(Point(1, 2)), "Point(x=1, y=2)")
+        self.assertEqual(repr(Point()), "Point(x=None, y=None)")
+        self.assertEqual(repr(JacobianPoint(1, 2, 3)), "JacobianPoint(x=1, y=2, z=3)")
+
+    def test_equality_and_hash(self):
+        """Test equality, and that equal points hash equally."""
+        self.assertEqual(Point(1, 2), Point(1, 2))
+        self.assertNotEqual(Point(1, 2), Point(1, 3))
+        self.assertNotEqual(Point(1, 2), JacobianPoint(1, 2))
+        self.assertNotEqual(Point(1, 2), (1, 2))
+        self.assertEqual(hash(Point(1, 2)), hash(Point(1, 2)))
+        self.assertEqual(hash(JacobianPoint(1, 2, 3)), hash((1, 2, 3)))
+        self.assertEqual(len({Point(1, 2), Point(1, 2), Point()}), 2)
+
+    def test_immutable(self):
+        """Test that points cannot be modified."""
+        for point in (Point(1, 2), JacobianPoint(1, 2, 3)):
+            with self.assertRaises(FrozenInstanceError):
+                point.x = 5
+            with self.assertRaises(FrozenInstanceError):
+                del point.y
+            with self.assertRaises(AttributeError):
+                point.w = 5
+            self.assertFalse(hasattr(point, "__dict__"))
+
+    def test_pickle_and_copy(self):
+        """Test that points survive pickling and copying."""
+        for point in (Point(1, 2), Point(), JacobianPoint(1, 2, 3)):
+            self.assertEqual(pickle.loads(pickle.dumps(point)), point)
+            self.assertEqual(copy.copy(point), point)
+            self.assertEqual(copy.deepcopy(point), point)
+
+    def test_not_dataclasses(self):
+        """Test the breaking change documented in the migration note: points are no
+        longer dataclasses, but keep their pattern matching arguments."""
+        for point in (Point(1, 2), JacobianPoint(1, 2, 3)):
+            self.assertFalse(dataclasses.is_dataclass(point))
+            with self.assertRaises(TypeError):
+                dataclasses.replace(point, x=5)
+            with self.assertRaises(TypeError):
+                dataclasses.asdict(point)
+        self.assertEqual(Point.__match_args__, ("x", "y"))
+        self.assertEqual(JacobianPoint.__match_args__, ("x", "y", "z"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from dataclasses import replace
+
+from ecutils import tables
+from ecutils.curves import get as get_curve
+
+
+class TestTables(unittest.TestCase):
+    """Test cases for the persistent store of precomputed tables."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        tables.set_table_dir(self.directory.name)
+        # Fresh copies of the curve, so that no table is cached yet
+        self.curve = replace(get_curve("secp192k1"))
+
+    def tearDown(self):
+        tables.set_table_dir(None)
+        self.directory.cleanup()
+
+    def test_disabled_without_directory(self):
+        """Test that nothing is read or written when no directory is configured."""
+        tables.set_table_dir(None)
+        self.assertIsNone(tables.table_path(self.curve, "generator_table", 4))
+        self.curve.generator_table
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_round_trip(self):
+        """Test that saved rows are loaded unchanged."""
+        rows = [[(1, 2), (3, 4)], [(5, 2**190 + 1), (7, 8)]]
+        tables.save(self.curve, "test", 3, rows)
+        self.assertEqual(tables.load(self.curve, "test", 3), rows)
+        self.assertIsNone(tables.load(self.curve, "test", 4))
+        self.assertIsNone(tables.load(get_curve("secp192r1"), "test", 3))
+
+    def test_warm_up_writes_and_loads_tables(self):
+        """Test that warm_up persists the generator tables, and that another instance
+        of the curve loads identical tables from the files."""
+        tables.warm_up([self.curve])
+        self.assertEqual(len(os.listdir(self.directory.name)), 2)
+
+        other = replace(get_curve("secp192k1"))
+        self.assertIsNotNone(
+            tables.load(other, "generator_table", other.generator_window_width)
+        )
+        self.assertEqual(other.generator_table, self.curve.generator_table)
+        self.assertEqual(
+            other.generator_odd_multiples, self.curve.generator_odd_multiples
+        )
+        k = 0xEA525DD5A1353762A14E9E78B9063316D1F2D5E792F87862
+        self.assertEqual(
+            other.multiply_point(k, other.G),
+            get_curve("secp192k1").multiply_point(k, other.G),
+        )
+
+    def test_warm_up_by_name(self):
+        """Test that curves can be warmed up by name."""
+        tables.warm_up(["secp192k1"])
+        self.assertEqual(len(os.listdir(self.directory.name)), 2)
+
+    def test_corrupt_file_is_rebuilt(self):
+        """Test that a truncated or mismatching file is ignored and replaced."""
+        w = self.curve.generator_window_width
+        path = tables.table_path(self.curve, "generator_table", w)
+        with open(path, "wb") as file:
+            file.write(b"ECTB\x01\x00")
+        self.assertIsNone(tables.load(self.curve, "generator_table", w))
+
+        expected = get_curve("secp192k1").generator_table
+        self.assertEqual(self.curve.generator_table, expected)
+        self.assertIsNotNone(tables.load(self.curve, "generator_table", w))
+
+    def test_flipped_bit_is_rebuilt(self):
+        """Test that a table file whose records were altered is not trusted."""
+        tables.warm_up([self.curve])
+        w = self.curve.generator_window_width
+        path = tables.table_path(self.curve, "generator_table", w)
+        with open(path, "r+b") as file:
+            file.seek(tables.HEADER.size + 5)
+            byte = file.read(1)
+            file.seek(-1, os.SEEK_CUR)
+            file.write(bytes([byte[0] ^ 1]))
+        self.assertIsNone(tables.load(self.curve, "generator_table", w))
+
+        other = replace(get_curve("secp192k1"))
+        k = 0x75BCD11
+        self.assertEqual(
+            other.multiply_point(k, other.G),
+            get_curve("secp192k1").multiply_point(k, other.G),
+        )
+        self.assertIsNotNone(tables.load(self.curve, "generator_table", w))
+
+
+if __name__ == "__main__":
+    unittest.main()